@@ -1,1766 +1,2694 @@
-import tkinter as tk
-from tkinter import ttk, messagebox, PhotoImage, Canvas, filedialog, StringVar, BooleanVar
-import tkinter.font as tkFont
-import threading
-import cv2
-import numpy as np
-from PIL import Image, ImageTk
-import os
-import json
-import datetime
-import time
-import math
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from collections import deque
-import webbrowser
-import sys
-import random
-import platform
-
-# Check if required packages are installed
-try:
-    from ultralytics import YOLO
-    import mediapipe as mp
-except ImportError:
-    print("Required packages not found. Installing...")
-    import subprocess
-    subprocess.check_call([sys.executable, "-m", "pip", "install", 
-                          "ultralytics", "mediapipe", "pillow", "matplotlib"])
-    from ultralytics import YOLO
-    import mediapipe as mp
-
-class ExercisePoseApp:
-    def __init__(self, root):
-        self.root = root
-        self.setup_window()
-        self.load_resources()
-        self.initialize_variables()
-        self.create_styles()
-        self.create_main_frame()
-        self.create_dashboard()
-        self.load_user_data()
-        
-    def setup_window(self):
-        self.root.title("Advanced Exercise Posture Assistant")
-        self.root.configure(bg="#121212")
-        self.screen_width = self.root.winfo_screenwidth()
-        self.screen_height = self.root.winfo_screenheight()
-        app_width = min(1280, int(self.screen_width * 0.9))
-        app_height = min(800, int(self.screen_height * 0.9))
-        self.root.geometry(f"{app_width}x{app_height}")
-        self.root.minsize(960, 600)
-        
-        # Make app responsive
-        self.root.columnconfigure(0, weight=1)
-        self.root.rowconfigure(0, weight=1)
-        
-        # Set app icon if OS is not macOS (which handles icons differently)
-        if platform.system() != "Darwin":
-            try:
-                self.root.iconbitmap("app_icon.ico")
-            except:
-                pass
-    
-    def load_resources(self):
-        # Prepare data directory
-        self.app_dir = os.path.join(os.path.expanduser("~"), "ExercisePoseApp")
-        os.makedirs(self.app_dir, exist_ok=True)
-        os.makedirs(os.path.join(self.app_dir, "data"), exist_ok=True)
-        os.makedirs(os.path.join(self.app_dir, "profiles"), exist_ok=True)
-        
-        # Load YOLO model
-        try:
-            model_path = os.path.join(self.app_dir, "best.pt")
-            if os.path.exists(model_path):
-                self.model = YOLO(model_path).to('cpu')
-            else:
-                # Use default model
-                self.model = YOLO("best.pt").to('cpu')
-        except Exception as e:
-            self.model = None
-            print(f"Error loading model: {e}")
-        
-        # MediaPipe setup
-        self.mp_pose = mp.solutions.pose
-        self.pose = self.mp_pose.Pose(
-            static_image_mode=False,
-            model_complexity=1,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.7
-        )
-        self.mp_drawing = mp.solutions.drawing_utils
-        self.drawing_spec = self.mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=2)
-        
-        # Load exercise data
-        self.exercise_data = {
-            "bicep curl": {
-                "name": "Bicep Curl",
-                "description": "Trains biceps by flexing at the elbow",
-                "keypoints": [11, 13, 15],  # shoulder, elbow, wrist
-                "target_angles": {"min": 30, "max": 160, "ideal": 90},
-                "level": "beginner",
-                "muscles": ["Biceps", "Forearms"],
-                "color": "#2980b9",
-                "feedback": {
-                    "too_extended": "Bend your arm more",
-                    "too_flexed": "Extend your arm more",
-                    "good": "Good form! Keep going",
-                    "complete": "Curl complete. Great job!"
-                }
-            },
-            "push-up": {
-                "name": "Push-Up",
-                "description": "Full body exercise focusing on chest and arms",
-                "keypoints": [11, 13, 15, 23, 25, 27],  # various upper body points
-                "target_angles": {"min": 80, "max": 160, "ideal": 90},
-                "level": "intermediate",
-                "muscles": ["Chest", "Shoulders", "Triceps", "Core"],
-                "color": "#27ae60",
-                "feedback": {
-                    "too_high": "Lower your body more",
-                    "too_low": "Push up more",
-                    "back_bent": "Keep your back straight",
-                    "good": "Good form! Keep your core tight"
-                }
-            },
-            "squat": {
-                "name": "Squat",
-                "description": "Lower body exercise for legs and glutes",
-                "keypoints": [23, 25, 27],  # hip, knee, ankle
-                "target_angles": {"min": 70, "max": 170, "ideal": 110},
-                "level": "intermediate",
-                "muscles": ["Quadriceps", "Hamstrings", "Glutes", "Core"],
-                "color": "#f39c12",
-                "feedback": {
-                    "too_high": "Squat deeper",
-                    "too_low": "Rise up more",
-                    "knees_forward": "Keep knees behind toes",
-                    "good": "Great depth! Keep chest up"
-                }
-            },
-            "shoulder press": {
-                "name": "Shoulder Press",
-                "description": "Upper body exercise targeting shoulders",
-                "keypoints": [11, 13, 15],  # shoulder, elbow, wrist
-                "target_angles": {"min": 60, "max": 170, "ideal": 160},
-                "level": "advanced",
-                "muscles": ["Shoulders", "Triceps", "Upper Back"],
-                "color": "#8e44ad",
-                "feedback": {
-                    "too_low": "Push higher",
-                    "elbows_out": "Keep elbows forward",
-                    "good": "Good form! Keep pushing",
-                    "locked_out": "Great lockout position"
-                }
-            }
-        }
-        
-    def initialize_variables(self):
-        self.camera_active = False
-        self.camera_id = 0
-        self.cap = None
-        self.current_exercise = None
-        self.angle_buffer = deque(maxlen=10)
-        self.prev_hip_y = None
-        self.session_start_time = None
-        self.session_reps = 0
-        self.session_angles = []
-        self.session_feedback = []
-        self.use_voice_feedback = BooleanVar(value=False)
-        self.show_skeleton = BooleanVar(value=True)
-        self.show_angles = BooleanVar(value=True)
-        self.camera_frame = None
-        self.processed_frame = None
-        self.canvas_width = 640
-        self.canvas_height = 480
-        self.current_user = "Default User"
-        self.dark_mode = BooleanVar(value=True)
-        self.calibration_mode = False
-        self.calibration_points = []
-        
-        # Create a dictionary to store theme colors
-        self.update_theme_colors()
-        
-    def update_theme_colors(self):
-        if self.dark_mode.get():
-            self.theme = {
-                "bg_main": "#121212",
-                "bg_secondary": "#1e1e1e",
-                "bg_tertiary": "#2d2d2d",
-                "text_primary": "#ffffff",
-                "text_secondary": "#bbbbbb",
-                "accent": "#8e44ad",
-                "highlight": "#f39c12",
-                "success": "#27ae60",
-                "warning": "#e67e22",
-                "error": "#e74c3c",
-                "shadow": "black"
-            }
-        else:
-            self.theme = {
-                "bg_main": "#f5f5f5",
-                "bg_secondary": "#ffffff",
-                "bg_tertiary": "#e0e0e0",
-                "text_primary": "#212121",
-                "text_secondary": "#757575",
-                "accent": "#9c27b0",
-                "highlight": "#f39c12",
-                "success": "#2ecc71",
-                "warning": "#f39c12",
-                "error": "#e74c3c",
-                "shadow": "#bbbbbb"
-            }
-        
-    def create_styles(self):
-        # Create custom fonts
-        self.title_font = tkFont.Font(family="Helvetica", size=24, weight="bold")
-        self.heading_font = tkFont.Font(family="Helvetica", size=18, weight="bold")
-        self.subheading_font = tkFont.Font(family="Helvetica", size=14, weight="bold")
-        self.normal_font = tkFont.Font(family="Helvetica", size=12)
-        self.small_font = tkFont.Font(family="Helvetica", size=10)
-        
-        # Configure ttk styles
-        self.style = ttk.Style()
-        self.style.configure("TFrame", background=self.theme["bg_main"])
-        self.style.configure("TLabel", background=self.theme["bg_main"], foreground=self.theme["text_primary"])
-        self.style.configure("TButton", font=self.normal_font, padding=10)
-        
-        # Custom button styles
-        self.style.configure("Primary.TButton", background=self.theme["accent"], foreground="white")
-        self.style.configure("Secondary.TButton", background=self.theme["bg_tertiary"], foreground=self.theme["text_primary"])
-        self.style.configure("Success.TButton", background=self.theme["success"], foreground="white")
-        self.style.configure("Warning.TButton", background=self.theme["warning"], foreground="white")
-        self.style.configure("Danger.TButton", background=self.theme["error"], foreground="white")
-        
-        # Configure progress bar style
-        self.style.configure("TProgressbar", thickness=15, background=self.theme["accent"])
-    
-    def create_main_frame(self):
-        self.main_frame = ttk.Frame(self.root)
-        self.main_frame.grid(row=0, column=0, sticky="nsew")
-        self.main_frame.columnconfigure(0, weight=1)
-        self.main_frame.rowconfigure(0, weight=1)
-        
-        # Create navigation frame
-        self.nav_frame = tk.Frame(self.main_frame, bg=self.theme["bg_secondary"], width=200)
-        self.nav_frame.grid(row=0, column=0, sticky="nsw", padx=0, pady=0)
-        
-        # Create app title
-        title_frame = tk.Frame(self.nav_frame, bg=self.theme["accent"], padx=10, pady=20)
-        title_frame.pack(fill='x')
-        
-        title_label = tk.Label(title_frame, text="Exercise\nPosture Pro", font=self.title_font, 
-                              bg=self.theme["accent"], fg="white")
-        title_label.pack(pady=5)
-        
-        # Create navigation buttons
-        self.create_nav_button("Dashboard", self.show_dashboard)
-        self.create_nav_button("Start Exercise", self.show_exercise_selection)
-        self.create_nav_button("Progress Tracker", self.show_progress)
-        self.create_nav_button("Settings", self.show_settings)
-        self.create_nav_button("Help", self.show_help)
-        
-        # Add app version and theme toggle at bottom
-        version_frame = tk.Frame(self.nav_frame, bg=self.theme["bg_secondary"], padx=10, pady=10)
-        version_frame.pack(side="bottom", fill='x')
-        
-        version_label = tk.Label(version_frame, text="Version 2.0", font=self.small_font, 
-                                bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"])
-        version_label.pack(side="left", pady=5)
-        
-        theme_toggle = ttk.Checkbutton(version_frame, text="", variable=self.dark_mode, 
-                                    command=self.toggle_theme, style="Switch.TCheckbutton")
-        theme_toggle.pack(side="right", pady=5)
-        
-        # Create content frame (where different pages will be shown)
-        self.content_frame = tk.Frame(self.main_frame, bg=self.theme["bg_main"])
-        self.content_frame.grid(row=0, column=1, sticky="nsew", padx=0, pady=0)
-        self.main_frame.columnconfigure(1, weight=4)  # Content takes most space
-        
-    def create_nav_button(self, text, command):
-        button_frame = tk.Frame(self.nav_frame, bg=self.theme["bg_secondary"])
-        button_frame.pack(fill='x')
-        
-        button = tk.Button(button_frame, text=text, font=self.normal_font,
-                         bg=self.theme["bg_secondary"], fg=self.theme["text_primary"],
-                         activebackground=self.theme["accent"], activeforeground="white",
-                         bd=0, padx=20, pady=15, anchor="w", width=20,
-                         command=command)
-        button.pack(fill='x')
-    
-    def toggle_theme(self):
-        self.update_theme_colors()
-        self.clear_frame(self.content_frame)
-        if self.current_page == "dashboard":
-            self.create_dashboard()
-        elif self.current_page == "exercise_selection":
-            self.show_exercise_selection()
-        elif self.current_page == "progress":
-            self.show_progress()
-        elif self.current_page == "settings":
-            self.show_settings()
-        elif self.current_page == "help":
-            self.show_help()
-        elif self.current_page == "exercise_view":
-            self.show_exercise_view(self.current_exercise)
-    
-    def create_dashboard(self):
-        self.current_page = "dashboard"
-        self.clear_frame(self.content_frame)
-        
-        # Create welcome header
-        welcome_frame = tk.Frame(self.content_frame, bg=self.theme["bg_main"], padx=20, pady=20)
-        welcome_frame.pack(fill='x')
-        
-        welcome_label = tk.Label(welcome_frame, text=f"Welcome, {self.current_user}",
-                                font=self.heading_font, bg=self.theme["bg_main"], fg=self.theme["text_primary"])
-        welcome_label.pack(anchor="w")
-        
-        date_label = tk.Label(welcome_frame, text=datetime.datetime.now().strftime("%A, %B %d, %Y"),
-                            font=self.normal_font, bg=self.theme["bg_main"], fg=self.theme["text_secondary"])
-        date_label.pack(anchor="w")
-        
-        # Create quick start section
-        quick_start_frame = tk.Frame(self.content_frame, bg=self.theme["bg_main"], padx=20, pady=10)
-        quick_start_frame.pack(fill='x')
-        
-        quick_start_label = tk.Label(quick_start_frame, text="Quick Start Exercise",
-                                   font=self.subheading_font, bg=self.theme["bg_main"], fg=self.theme["text_primary"])
-        quick_start_label.pack(anchor="w", pady=(0, 10))
-        
-        # Create grid for exercise cards
-        exercise_grid = tk.Frame(quick_start_frame, bg=self.theme["bg_main"])
-        exercise_grid.pack(fill='x')
-        
-        # Create exercise cards
-        col = 0
-        for exercise_key, exercise_info in self.exercise_data.items():
-            self.create_exercise_card(exercise_grid, exercise_key, col)
-            col += 1
-        
-        # Create recent activity section
-        recent_frame = tk.Frame(self.content_frame, bg=self.theme["bg_main"], padx=20, pady=10)
-        recent_frame.pack(fill='x', pady=20)
-        
-        recent_label = tk.Label(recent_frame, text="Recent Activity",
-                             font=self.subheading_font, bg=self.theme["bg_main"], fg=self.theme["text_primary"])
-        recent_label.pack(anchor="w", pady=(0, 10))
-        
-        # Create empty state or load recent activities
-        recent_activities = self.load_recent_activities()
-        if recent_activities:
-            for activity in recent_activities[:3]:  # Show only last 3 activities
-                self.create_activity_item(recent_frame, activity)
-        else:
-            no_activity = tk.Label(recent_frame, text="No recent activities. Start exercising to track your progress!",
-                                 font=self.normal_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_secondary"],
-                                 padx=15, pady=30)
-            no_activity.pack(fill='x', padx=5, pady=5)
-        
-        # Create tips section
-        tips_frame = tk.Frame(self.content_frame, bg=self.theme["bg_main"], padx=20, pady=10)
-        tips_frame.pack(fill='x', pady=10)
-        
-        tips_label = tk.Label(tips_frame, text="Exercise Tips",
-                           font=self.subheading_font, bg=self.theme["bg_main"], fg=self.theme["text_primary"])
-        tips_label.pack(anchor="w", pady=(0, 10))
-        
-        tips = [
-            "Remember to warm up before starting any exercise",
-            "Stay hydrated during your workout sessions",
-            "Maintain proper form for maximum effectiveness",
-            "Track your progress to stay motivated"
-        ]
-        
-        tip_box = tk.Frame(tips_frame, bg=self.theme["bg_tertiary"], padx=15, pady=15,
-                         highlightbackground=self.theme["accent"], highlightthickness=1)
-        tip_box.pack(fill='x')
-        
-        tip_text = tk.Label(tip_box, text=random.choice(tips), font=self.normal_font,
-                          bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"], wraplength=800)
-        tip_text.pack(anchor="w")
-    
-    def create_exercise_card(self, parent, exercise_key, col):
-        exercise = self.exercise_data[exercise_key]
-        
-        # Create card frame
-        card = tk.Frame(parent, bg=self.theme["bg_secondary"], padx=15, pady=15,
-                      highlightbackground=exercise["color"], highlightthickness=1)
-        card.grid(row=0, column=col, padx=10, pady=10, sticky="nsew")
-        
-        # Add exercise name
-        name_label = tk.Label(card, text=exercise["name"], font=self.subheading_font,
-                            bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
-        name_label.pack(anchor="w")
-        
-        # Add difficulty level
-        level_label = tk.Label(card, text=exercise["level"].capitalize(),
-                             font=self.small_font, bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"])
-        level_label.pack(anchor="w", pady=(0, 10))
-        
-        # Add muscles worked
-        muscles_text = ", ".join(exercise["muscles"])
-        muscles_label = tk.Label(card, text=f"Targets: {muscles_text}",
-                               font=self.small_font, bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"],
-                               wraplength=180)
-        muscles_label.pack(anchor="w", pady=(0, 10))
-        
-        # Add start button
-        start_button = tk.Button(card, text="Start", font=self.normal_font,
-                               bg=exercise["color"], fg="white", padx=10, pady=5,
-                               command=lambda e=exercise_key: self.show_exercise_view(e))
-        start_button.pack(anchor="w")
-    
-    def create_activity_item(self, parent, activity):
-        # Create activity item frame
-        item_frame = tk.Frame(parent, bg=self.theme["bg_tertiary"], padx=15, pady=15)
-        item_frame.pack(fill='x', padx=5, pady=5)
-        
-        # Add activity date/time
-        date_label = tk.Label(item_frame, text=activity["date"], font=self.small_font,
-                            bg=self.theme["bg_tertiary"], fg=self.theme["text_secondary"])
-        date_label.pack(anchor="w")
-        
-        # Add activity details
-        detail_frame = tk.Frame(item_frame, bg=self.theme["bg_tertiary"])
-        detail_frame.pack(fill='x', pady=(5, 0))
-        
-        exercise_label = tk.Label(detail_frame, text=activity["exercise"],
-                                font=self.normal_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"])
-        exercise_label.pack(side="left")
-        
-        duration_label = tk.Label(detail_frame, text=f"{activity['duration']} min",
-                                font=self.normal_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_secondary"])
-        duration_label.pack(side="right")
-        
-        # Add performance bar if available
-        if "performance" in activity:
-            perf_frame = tk.Frame(item_frame, bg=self.theme["bg_tertiary"], pady=5)
-            perf_frame.pack(fill='x')
-            
-            perf_text = tk.Label(perf_frame, text="Performance:",
-                               font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_secondary"])
-            perf_text.pack(side="left")
-            
-            perf_val = tk.Label(perf_frame, text=f"{activity['performance']}%",
-                              font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"])
-            perf_val.pack(side="right")
-            
-            # Performance bar background
-            bar_bg = tk.Frame(item_frame, bg=self.theme["bg_secondary"], height=8)
-            bar_bg.pack(fill='x', pady=(0, 5))
-            
-            # Performance bar fill
-            performance = min(100, max(0, activity["performance"]))
-            bar_fill = tk.Frame(bar_bg, bg=self.get_performance_color(performance), height=8, width=int(bar_bg.winfo_reqwidth() * performance / 100))
-            bar_fill.pack(side="left", anchor="w")
-    
-    def get_performance_color(self, performance):
-        if performance >= 80:
-            return self.theme["success"]
-        elif performance >= 60:
-            return self.theme["warning"]
-        else:
-            return self.theme["error"]
-    
-    def clear_frame(self, frame):
-        # Destroy all widgets in the frame
-        for widget in frame.winfo_children():
-            widget.destroy()
-    
-    def show_dashboard(self):
-        self.clear_frame(self.content_frame)
-        self.create_dashboard()
-    
-    def show_exercise_selection(self):
-        self.current_page = "exercise_selection"
-        self.clear_frame(self.content_frame)
-        
-        # Create header
-        header_frame = tk.Frame(self.content_frame, bg=self.theme["bg_main"], padx=20, pady=20)
-        header_frame.pack(fill='x')
-        
-        header_label = tk.Label(header_frame, text="Select an Exercise",
-                               font=self.heading_font, bg=self.theme["bg_main"], fg=self.theme["text_primary"])
-        header_label.pack(anchor="w")
-        
-        # Create grid for exercise detail cards
-        exercises_frame = tk.Frame(self.content_frame, bg=self.theme["bg_main"], padx=20, pady=10)
-        exercises_frame.pack(fill='both', expand=True)
-        
-        row, col = 0, 0
-        for i, (exercise_key, exercise_info) in enumerate(self.exercise_data.items()):
-            if i % 2 == 0 and i > 0:
-                row += 1
-                col = 0
-                
-            self.create_exercise_detail_card(exercises_frame, exercise_key, exercise_info, row, col)
-            col += 1
-    
-    def create_exercise_detail_card(self, parent, exercise_key, exercise_info, row, col):
-        # Create card frame
-        card = tk.Frame(parent, bg=self.theme["bg_secondary"], padx=20, pady=20,
-                      highlightbackground=exercise_info["color"], highlightthickness=1)
-        card.grid(row=row, column=col, padx=15, pady=15, sticky="nsew")
-        
-        # Add exercise name with colored indicator
-        name_frame = tk.Frame(card, bg=self.theme["bg_secondary"])
-        name_frame.pack(fill='x', pady=(0, 10))
-        
-        indicator = tk.Frame(name_frame, bg=exercise_info["color"], width=5, height=25)
-        indicator.pack(side="left", padx=(0, 10))
-        
-        name_label = tk.Label(name_frame, text=exercise_info["name"], font=self.subheading_font,
-                            bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
-        name_label.pack(side="left")
-        
-        # Add difficulty level
-        level_frame = tk.Frame(card, bg=self.theme["bg_secondary"])
-        level_frame.pack(fill='x', pady=(0, 10))
-        
-        level_label = tk.Label(level_frame, text="Difficulty:",
-                             font=self.small_font, bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"])
-        level_label.pack(side="left")
-        
-        # Add level indicator
-        level_indicator = tk.Frame(level_frame, bg=self.theme["bg_secondary"])
-        level_indicator.pack(side="left", padx=(5, 0))
-        
-        level = exercise_info["level"]
-        colors = {"beginner": self.theme["success"], 
-                 "intermediate": self.theme["warning"], 
-                 "advanced": self.theme["error"]}
-        levels = {"beginner": 1, "intermediate": 2, "advanced": 3}
-        
-        for i in range(3):
-            indicator = tk.Frame(level_indicator, bg=colors[level] if i < levels[level] else self.theme["bg_tertiary"],
-                               width=15, height=8)
-            indicator.pack(side="left", padx=2)
-        
-        level_text = tk.Label(level_frame, text=level.capitalize(),
-                            font=self.small_font, bg=self.theme["bg_secondary"], fg=colors[level])
-        level_text.pack(side="left", padx=(5, 0))
-        
-        # Add description
-        desc_label = tk.Label(card, text=exercise_info["description"],
-                            font=self.normal_font, bg=self.theme["bg_secondary"], fg=self.theme["text_primary"],
-                            wraplength=350, justify="left")
-        desc_label.pack(anchor="w", pady=(0, 15))
-        
-        # Add muscles targeted
-        muscles_frame = tk.Frame(card, bg=self.theme["bg_secondary"])
-        muscles_frame.pack(fill='x', pady=(0, 15))
-        
-        muscles_label = tk.Label(muscles_frame, text="Muscles:",
-                               font=self.small_font, bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"])
-        muscles_label.pack(side="left")
-        
-        muscles_text = ", ".join(exercise_info["muscles"])
-        muscles_value = tk.Label(muscles_frame, text=muscles_text,
-                               font=self.small_font, bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
-        muscles_value.pack(side="left", padx=(5, 0))
-        
-        # Add target angle
-        angle_frame = tk.Frame(card, bg=self.theme["bg_secondary"])
-        angle_frame.pack(fill='x', pady=(0, 15))
-        
-        angle_label = tk.Label(angle_frame, text="Ideal Angle:",
-                             font=self.small_font, bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"])
-        angle_label.pack(side="left")
-        
-        angle_value = tk.Label(angle_frame, text=f"{exercise_info['target_angles']['ideal']}°",
-                             font=self.small_font, bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
-        angle_value.pack(side="left", padx=(5, 0))
-        
-        # Add buttons
-        button_frame = tk.Frame(card, bg=self.theme["bg_secondary"])
-        button_frame.pack(fill='x')
-        
-        start_button = tk.Button(button_frame, text="Start Exercise", font=self.normal_font,
-                               bg=exercise_info["color"], fg="white", padx=15, pady=8,
-                               command=lambda e=exercise_key: self.show_exercise_view(e))
-        start_button.pack(side="right")
-        
-        demo_button = tk.Button(button_frame, text="View Demo", font=self.normal_font,
-                              bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"], padx=15, pady=8,
-                              command=lambda e=exercise_info["name"]: self.show_demo(e))
-        demo_button.pack(side="right", padx=(0, 10))
-    
-    def show_demo(self, exercise_name):
-        # In a real app, this would display a video or animation
-        # For this example, just show a message
-        messagebox.showinfo("Demo", f"This would show a demonstration video for {exercise_name}.")
-    
-    def show_exercise_view(self, exercise_key):
-        self.current_page = "exercise_view"
-        self.current_exercise = exercise_key
-        self.clear_frame(self.content_frame)
-        exercise = self.exercise_data[exercise_key]
-        
-        # Create header
-        header_frame = tk.Frame(self.content_frame, bg=self.theme["bg_main"], padx=20, pady=20)
-        header_frame.pack(fill='x')
-        
-        # Add back button
-        back_button = tk.Button(header_frame, text="← Back", font=self.normal_font,
-                              bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"], padx=10, pady=5,
-                              command=self.show_dashboard)
-        back_button.pack(side="left")
-        
-        # Add exercise name
-        title_label = tk.Label(header_frame, text=exercise["name"], font=self.heading_font,
-                             bg=self.theme["bg_main"], fg=self.theme["text_primary"])
-        title_label.pack(side="left", padx=(20, 0))
-        
-        # Create main content with camera feed and controls
-        content_frame = tk.Frame(self.content_frame, bg=self.theme["bg_main"], padx=20)
-        content_frame.pack(fill='both', expand=True)
-        
-        # Left panel for camera feed
-        left_panel = tk.Frame(content_frame, bg=self.theme["bg_secondary"])
-        left_panel.pack(side="left", fill='both', expand=True, padx=(0, 10))
-        
-        # Camera canvas
-        camera_frame = tk.Frame(left_panel, bg="black")
-        camera_frame.pack(pady=10, padx=10)
-        
-        self.camera_canvas = tk.Canvas(camera_frame, width=self.canvas_width, height=self.canvas_height, bg="black",
-                                     highlightthickness=0)
-        self.camera_canvas.pack()
-        
-        # Placeholder for camera
-        placeholder_text = tk.Label(self.camera_canvas, text="Camera feed will appear here",
-                                  font=self.normal_font, bg="black", fg="white")
-        placeholder_text.place(relx=0.5, rely=0.5, anchor="center")
-        
-        # Camera controls
-        controls_frame = tk.Frame(left_panel, bg=self.theme["bg_secondary"], padx=10, pady=10)
-        controls_frame.pack(fill='x')
-        
-        # Start/Stop camera button
-        self.camera_button = tk.Button(controls_frame, text="Start Camera", font=self.normal_font,
-                                     bg=self.theme["success"], fg="white", padx=15, pady=5,
-                                     command=self.toggle_camera)
-        self.camera_button.pack(side="left")
-        
-        # Camera options
-        camera_options = tk.Frame(controls_frame, bg=self.theme["bg_secondary"])
-        camera_options.pack(side="right")
-        
-        # Show skeleton checkbox
-        skeleton_check = ttk.Checkbutton(camera_options, text="Show Skeleton", variable=self.show_skeleton,
-                                       style="TCheckbutton")
-        skeleton_check.pack(side="left", padx=10)
-        
-        # Show angles checkbox
-        angles_check = ttk.Checkbutton(camera_options, text="Show Angles", variable=self.show_angles,
-                                     style="TCheckbutton")
-        angles_check.pack(side="left", padx=10)
-        
-        # Right panel for stats and feedback
-        right_panel = tk.Frame(content_frame, bg=self.theme["bg_tertiary"], width=300)
-        right_panel.pack(side="right", fill='both', padx=(10, 0))
-        
-        # Add exercise details
-        details_frame = tk.Frame(right_panel, bg=self.theme["bg_tertiary"], padx=15, pady=15)
-        details_frame.pack(fill='x')
-        
-        details_label = tk.Label(details_frame, text="Exercise Details",
-                               font=self.subheading_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"])
-        details_label.pack(anchor="w", pady=(0, 10))
-        
-        # Muscles worked
-        muscles_frame = tk.Frame(details_frame, bg=self.theme["bg_tertiary"])
-        muscles_frame.pack(fill='x', pady=5)
-        
-        muscles_label = tk.Label(muscles_frame, text="Muscles:",
-                               font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_secondary"])
-        muscles_label.pack(side="left")
-        
-        muscles_text = ", ".join(exercise["muscles"])
-        muscles_value = tk.Label(muscles_frame, text=muscles_text,
-                               font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"])
-        muscles_value.pack(side="left", padx=(5, 0))
-        
-        # Target angle
-        angle_frame = tk.Frame(details_frame, bg=self.theme["bg_tertiary"])
-        angle_frame.pack(fill='x', pady=5)
-        
-        angle_label = tk.Label(angle_frame, text="Target Angle:",
-                             font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_secondary"])
-        angle_label.pack(side="left")
-        
-        angle_range = f"{exercise['target_angles']['min']}° - {exercise['target_angles']['max']}°"
-        angle_value = tk.Label(angle_frame, text=angle_range,
-                             font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"])
-        angle_value.pack(side="left", padx=(5, 0))
-        
-        # Difficulty
-        diff_frame = tk.Frame(details_frame, bg=self.theme["bg_tertiary"])
-        diff_frame.pack(fill='x', pady=5)
-        
-        diff_label = tk.Label(diff_frame, text="Difficulty:",
-                            font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_secondary"])
-        diff_label.pack(side="left")
-        
-        diff_value = tk.Label(diff_frame, text=exercise["level"].capitalize(),
-                            font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"])
-        diff_value.pack(side="left", padx=(5, 0))
-        
-        # Add current stats
-        stats_frame = tk.Frame(right_panel, bg=self.theme["bg_tertiary"], padx=15, pady=15)
-        stats_frame.pack(fill='x', pady=10)
-        
-        stats_label = tk.Label(stats_frame, text="Current Session",
-                             font=self.subheading_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"])
-        stats_label.pack(anchor="w", pady=(0, 10))
-        
-        # Time counter
-        time_frame = tk.Frame(stats_frame, bg=self.theme["bg_tertiary"])
-        time_frame.pack(fill='x', pady=5)
-        
-        time_label = tk.Label(time_frame, text="Duration:",
-                            font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_secondary"])
-        time_label.pack(side="left")
-        
-        self.time_value = tk.Label(time_frame, text="00:00",
-                                 font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"])
-        self.time_value.pack(side="left", padx=(5, 0))
-        
-        # Rep counter
-        rep_frame = tk.Frame(stats_frame, bg=self.theme["bg_tertiary"])
-        rep_frame.pack(fill='x', pady=5)
-        
-        rep_label = tk.Label(rep_frame, text="Repetitions:",
-                           font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_secondary"])
-        rep_label.pack(side="left")
-        
-        self.rep_value = tk.Label(rep_frame, text="0",
-                                font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"])
-        self.rep_value.pack(side="left", padx=(5, 0))
-        
-        # Current angle
-        curr_angle_frame = tk.Frame(stats_frame, bg=self.theme["bg_tertiary"])
-        curr_angle_frame.pack(fill='x', pady=5)
-        
-        curr_angle_label = tk.Label(curr_angle_frame, text="Current Angle:",
-                                  font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_secondary"])
-        curr_angle_label.pack(side="left")
-        
-        self.curr_angle_value = tk.Label(curr_angle_frame, text="0°",
-                                       font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"])
-        self.curr_angle_value.pack(side="left", padx=(5, 0))
-        
-        # Add feedback section
-        feedback_frame = tk.Frame(right_panel, bg=self.theme["bg_tertiary"], padx=15, pady=15)
-        feedback_frame.pack(fill='x', pady=10)
-        
-        feedback_label = tk.Label(feedback_frame, text="Feedback",
-                                font=self.subheading_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"])
-        feedback_label.pack(anchor="w", pady=(0, 10))
-        
-        self.feedback_box = tk.Label(feedback_frame, text="Start camera to begin receiving feedback",
-                                   font=self.normal_font, bg=self.theme["bg_main"], fg=self.theme["text_primary"],
-                                   wraplength=250, justify="center", padx=20, pady=20, height=5)
-        self.feedback_box.pack(fill='x')
-        
-        # Add voice feedback option
-        voice_frame = tk.Frame(right_panel, bg=self.theme["bg_tertiary"], padx=15, pady=15)
-        voice_frame.pack(fill='x')
-        
-        voice_check = ttk.Checkbutton(voice_frame, text="Voice Feedback", variable=self.use_voice_feedback,
-                                     style="TCheckbutton")
-        voice_check.pack(side="left")
-        
-        # Add end session button
-        end_button = tk.Button(right_panel, text="End Session", font=self.normal_font,
-                             bg=self.theme["error"], fg="white", padx=15, pady=10,
-                             command=self.end_exercise_session)
-        end_button.pack(pady=20)
-    
-    def toggle_camera(self):
-        if self.camera_active:
-            self.stop_camera()
-        else:
-            self.start_camera()
-    
-    def start_camera(self):
-        if self.cap is not None:
-            return
-            
-        self.session_start_time = time.time()
-        self.session_reps = 0
-        self.angle_buffer.clear()
-        self.session_angles = []
-        self.session_feedback = []
-        
-        # Start camera
-        try:
-            self.cap = cv2.VideoCapture(self.camera_id)
-            if not self.cap.isOpened():
-                messagebox.showerror("Error", "Could not open camera. Please check your camera settings.")
-                self.cap = None
-                return
-                
-            self.camera_active = True
-            self.camera_button.config(text="Stop Camera", bg=self.theme["error"])
-            
-            # Start camera thread
-            self.camera_thread = threading.Thread(target=self.process_camera_feed)
-            self.camera_thread.daemon = True
-            self.camera_thread.start()
-            
-            # Start timer update
-            self.timer_thread = threading.Thread(target=self.update_session_time)
-            self.timer_thread.daemon = True
-            self.timer_thread.start()
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Error starting camera: {str(e)}")
-    
-    def stop_camera(self):
-        self.camera_active = False
-        if self.cap:
-            self.cap.release()
-            self.cap = None
-        self.camera_button.config(text="Start Camera", bg=self.theme["success"])
-    
-    def process_camera_feed(self):
-        prev_angle = None
-        direction = None
-        rep_counted = False
-        
-        while self.camera_active and self.cap and self.cap.isOpened():
-            ret, frame = self.cap.read()
-            if not ret:
-                break
-                
-            # Resize frame for display
-            display_frame = cv2.resize(frame, (self.canvas_width, self.canvas_height))
-            
-            # Process with MediaPipe
-            image_rgb = cv2.cvtColor(display_frame, cv2.COLOR_BGR2RGB)
-            pose_results = self.pose.process(image_rgb)
-            
-            # Create a copy for drawing
-            output_frame = display_frame.copy()
-            
-            if pose_results.pose_landmarks:
-                # Extract landmarks
-                landmarks = []
-                for i, lm in enumerate(pose_results.pose_landmarks.landmark):
-                    h, w, _ = output_frame.shape
-                    px, py = int(lm.x * w), int(lm.y * h)
-                    landmarks.append((px, py))
-                    
-                # Draw skeleton if enabled
-                if self.show_skeleton.get():
-                    self.mp_drawing.draw_landmarks(
-                        output_frame, 
-                        pose_results.pose_landmarks,
-                        self.mp_pose.POSE_CONNECTIONS,
-                        self.drawing_spec,
-                        self.drawing_spec
-                    )
-                    
-                # Calculate angle for current exercise
-                exercise = self.exercise_data[self.current_exercise]
-                
-                # Get keypoints for current exercise
-                keypoints = exercise["keypoints"]
-                target_angles = exercise["target_angles"]
-                
-                # Calculate angle
-                if len(keypoints) >= 3:
-                    a = landmarks[keypoints[0]]
-                    b = landmarks[keypoints[1]]
-                    c = landmarks[keypoints[2]]
-                    
-                    angle = self.calculate_angle(a, b, c)
-                    self.angle_buffer.append(angle)
-                    avg_angle = sum(self.angle_buffer) / len(self.angle_buffer)
-                    
-                    # Store for analysis
-                    self.session_angles.append(avg_angle)
-                    
-                    # Draw angle if enabled
-                    if self.show_angles.get():
-                        # Draw angle lines
-                        cv2.line(output_frame, b, a, (0, 255, 0), 2)
-                        cv2.line(output_frame, b, c, (0, 255, 0), 2)
-                        
-                        # Draw angle value
-                        angle_text = f"{int(avg_angle)}°"
-                        cv2.putText(output_frame, angle_text, 
-                                   (b[0] - 50, b[1] + 50), 
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
-                    
-                    # Update angle display
-                    self.root.after(10, lambda a=int(avg_angle): self.curr_angle_value.config(text=f"{a}°"))
-                    
-                    # Track rep counting
-                    if prev_angle is not None:
-                        if avg_angle > prev_angle:
-                            current_direction = "up"
-                        else:
-                            current_direction = "down"
-                            
-                        # Detect rep for different exercises
-                        if self.current_exercise == "bicep curl":
-                            # Rep is complete when going from flexed to extended position
-                            if (direction == "down" and current_direction == "up" and 
-                                prev_angle < target_angles["min"] + 10):
-                                if not rep_counted:
-                                    self.session_reps += 1
-                                    self.root.after(10, lambda r=self.session_reps: self.rep_value.config(text=str(r)))
-                                    rep_counted = True
-                            elif avg_angle > target_angles["max"] - 20:
-                                rep_counted = False
-                                
-                        elif self.current_exercise == "push-up":
-                            # Rep is complete when going from down to up position
-                            if (direction == "up" and current_direction == "down" and 
-                                prev_angle > target_angles["max"] - 20):
-                                if not rep_counted:
-                                    self.session_reps += 1
-                                    self.root.after(10, lambda r=self.session_reps: self.rep_value.config(text=str(r)))
-                                    rep_counted = True
-                            elif avg_angle < target_angles["min"] + 20:
-                                rep_counted = False
-                                
-                        elif self.current_exercise == "squat":
-                            # Rep is complete when going from down to up position
-                            if (direction == "up" and current_direction == "down" and 
-                                prev_angle > target_angles["max"] - 20):
-                                if not rep_counted:
-                                    self.session_reps += 1
-                                    self.root.after(10, lambda r=self.session_reps: self.rep_value.config(text=str(r)))
-                                    rep_counted = True
-                            elif avg_angle < target_angles["min"] + 20:
-                                rep_counted = False
-                                
-                        elif self.current_exercise == "shoulder press":
-                            # Rep is complete when going from down to up position
-                            if (direction == "down" and current_direction == "up" and 
-                                prev_angle > target_angles["max"] - 10):
-                                if not rep_counted:
-                                    self.session_reps += 1
-                                    self.root.after(10, lambda r=self.session_reps: self.rep_value.config(text=str(r)))
-                                    rep_counted = True
-                            elif avg_angle < target_angles["min"] + 10:
-                                rep_counted = False
-                        
-                        direction = current_direction
-                    else:
-                        direction = "none"
-                    
-                    prev_angle = avg_angle
-                    
-                    # Generate feedback
-                    feedback = self.generate_feedback(avg_angle, target_angles, self.current_exercise)
-                    self.session_feedback.append(feedback)
-                    
-                    # Show feedback
-                    feedback_color = self.theme["success"] if "Good" in feedback else (
-                                    self.theme["warning"] if "Complete" in feedback else self.theme["error"])
-                    self.root.after(10, lambda f=feedback, c=feedback_color: 
-                                   self.feedback_box.config(text=f, bg=c, fg="white"))
-                
-            # Convert frame for tkinter display
-            self.processed_frame = cv2.cvtColor(output_frame, cv2.COLOR_BGR2RGB)
-            img = Image.fromarray(self.processed_frame)
-            imgtk = ImageTk.PhotoImage(image=img)
-            
-            # Update canvas with new frame
-            self.root.after(10, lambda i=imgtk: self.update_camera_canvas(i))
-            
-            # Delay to reduce CPU usage
-            time.sleep(0.03)
-    
-    def update_camera_canvas(self, imgtk):
-        if self.camera_active:
-            self.camera_canvas.create_image(0, 0, anchor="nw", image=imgtk)
-            self.camera_canvas.image = imgtk
-    
-    def generate_feedback(self, angle, target_angles, exercise_type):
-        feedback = "No feedback available"
-        
-        if exercise_type == "bicep curl":
-            if angle > target_angles["max"] - 10:
-                feedback = "Extend more"
-            elif angle < target_angles["min"] + 10:
-                feedback = "Curl Complete"
-            else:
-                feedback = "Good Form"
-                
-        elif exercise_type == "push-up":
-            if angle > target_angles["max"] - 10:
-                feedback = "Keep body straight"
-            elif angle < target_angles["min"] + 10:
-                feedback = "Good Form"
-            else:
-                feedback = "Adjust your posture"
-                
-        elif exercise_type == "squat":
-            if angle < target_angles["min"] + 10:
-                feedback = "Too Low"
-            elif angle > target_angles["max"] - 10:
-                feedback = "Stand Up Straight"
-            else:
-                feedback = "Good Squat"
-                
-        elif exercise_type == "shoulder press":
-            if angle > target_angles["max"] - 10:
-                feedback = "Locked Out"
-            elif angle < target_angles["min"] + 10:
-                feedback = "Push Higher"
-            else:
-                feedback = "Good Form"
-                
-        return feedback
-    
-    def update_session_time(self):
-        while self.camera_active:
-            if self.session_start_time:
-                elapsed = int(time.time() - self.session_start_time)
-                minutes = elapsed // 60
-                seconds = elapsed % 60
-                time_string = f"{minutes:02d}:{seconds:02d}"
-                self.root.after(10, lambda t=time_string: self.time_value.config(text=t))
-            time.sleep(1)
-    
-    def end_exercise_session(self):
-        if self.camera_active:
-            self.stop_camera()
-            
-            # Calculate session stats
-            if self.session_start_time:
-                duration = int(time.time() - self.session_start_time)
-                
-                # Save session
-                self.save_session(duration)
-                
-                # Show summary
-                self.show_session_summary(duration)
-    
-    def save_session(self, duration):
-        if not self.session_angles:
-            return
-            
-        # Calculate performance score based on how well angles match target
-        exercise = self.exercise_data[self.current_exercise]
-        target = exercise["target_angles"]["ideal"]
-        max_deviation = max(target - exercise["target_angles"]["min"], 
-                          exercise["target_angles"]["max"] - target)
-        
-        deviations = []
-        for angle in self.session_angles:
-            deviation = abs(angle - target) / max_deviation
-            deviations.append(min(1.0, deviation))
-        
-        avg_deviation = sum(deviations) / len(deviations)
-        performance = int((1 - avg_deviation) * 100)
-        
-        # Create session record
-        session = {
-            "date": datetime.datetime.now().strftime("%Y-%m-%d %H:%M"),
-            "exercise": exercise["name"],
-            "duration": duration // 60,  # Convert to minutes
-            "reps": self.session_reps,
-            "performance": performance,
-            "angles": self.session_angles[:100]  # Limit to 100 records
-        }
-        
-        # Load existing activities
-        activities = self.load_recent_activities()
-        activities.append(session)
-        
-        # Save activities (keep only latest 20)
-        with open(os.path.join(self.app_dir, "data", "activities.json"), "w") as f:
-            json.dump(activities[-20:], f)
-    
-    def show_session_summary(self, duration):
-        # Create popup window
-        summary = tk.Toplevel(self.root)
-        summary.title("Session Summary")
-        summary.geometry("600x500")
-        summary.configure(bg=self.theme["bg_main"])
-        summary.transient(self.root)
-        summary.grab_set()
-        
-        # Add header
-        header_frame = tk.Frame(summary, bg=self.theme["bg_main"], padx=20, pady=20)
-        header_frame.pack(fill='x')
-        
-        header_label = tk.Label(header_frame, text="Session Complete!", font=self.heading_font,
-                              bg=self.theme["bg_main"], fg=self.theme["text_primary"])
-        header_label.pack(anchor="w")
-        
-        exercise = self.exercise_data[self.current_exercise]["name"]
-        subheader_label = tk.Label(header_frame, text=f"Exercise: {exercise}", font=self.subheading_font,
-                                 bg=self.theme["bg_main"], fg=self.theme["text_primary"])
-        subheader_label.pack(anchor="w")
-        
-        # Add stats
-        stats_frame = tk.Frame(summary, bg=self.theme["bg_main"], padx=20, pady=10)
-        stats_frame.pack(fill='x')
-        
-        stats_label = tk.Label(stats_frame, text="Session Statistics", font=self.subheading_font,
-                             bg=self.theme["bg_main"], fg=self.theme["text_primary"])
-        stats_label.pack(anchor="w", pady=(0, 10))
-        
-        # Create 2x2 grid for stats
-        grid_frame = tk.Frame(stats_frame, bg=self.theme["bg_main"])
-        grid_frame.pack(fill='x')
-        
-        # Duration
-        duration_frame = tk.Frame(grid_frame, bg=self.theme["bg_secondary"], padx=15, pady=15)
-        duration_frame.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
-        
-        duration_label = tk.Label(duration_frame, text="Duration", font=self.normal_font,
-                                bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"])
-        duration_label.pack(anchor="w")
-        
-        minutes = duration // 60
-        seconds = duration % 60
-        time_string = f"{minutes}m {seconds}s"
-        duration_value = tk.Label(duration_frame, text=time_string, font=self.subheading_font,
-                                bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
-        duration_value.pack(anchor="w")
-        
-        # Repetitions
-        reps_frame = tk.Frame(grid_frame, bg=self.theme["bg_secondary"], padx=15, pady=15)
-        reps_frame.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
-        
-        reps_label = tk.Label(reps_frame, text="Repetitions", font=self.normal_font,
-                            bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"])
-        reps_label.pack(anchor="w")
-        
-        reps_value = tk.Label(reps_frame, text=str(self.session_reps), font=self.subheading_font,
-                            bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
-        reps_value.pack(anchor="w")
-        
-        # Performance
-        if self.session_angles:
-            exercise = self.exercise_data[self.current_exercise]
-            target = exercise["target_angles"]["ideal"]
-            max_deviation = max(target - exercise["target_angles"]["min"], 
-                              exercise["target_angles"]["max"] - target)
-            
-            deviations = []
-            for angle in self.session_angles:
-                deviation = abs(angle - target) / max_deviation
-                deviations.append(min(1.0, deviation))
-            
-            avg_deviation = sum(deviations) / len(deviations)
-            performance = int((1 - avg_deviation) * 100)
-            
-            perf_frame = tk.Frame(grid_frame, bg=self.theme["bg_secondary"], padx=15, pady=15)
-            perf_frame.grid(row=1, column=0, padx=10, pady=10, sticky="nsew")
-            
-            perf_label = tk.Label(perf_frame, text="Performance", font=self.normal_font,
-                                bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"])
-            perf_label.pack(anchor="w")
-            
-            perf_value = tk.Label(perf_frame, text=f"{performance}%", font=self.subheading_font,
-                                bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
-            perf_value.pack(anchor="w")
-            
-            # Common feedback
-            feedback_counts = {}
-            for feedback in self.session_feedback:
-                if feedback in feedback_counts:
-                    feedback_counts[feedback] += 1
-                else:
-                    feedback_counts[feedback] = 1
-                    
-            most_common = max(feedback_counts.items(), key=lambda x: x[1])
-            
-            feedback_frame = tk.Frame(grid_frame, bg=self.theme["bg_secondary"], padx=15, pady=15)
-            feedback_frame.grid(row=1, column=1, padx=10, pady=10, sticky="nsew")
-            
-            feedback_label = tk.Label(feedback_frame, text="Most Common Feedback", font=self.normal_font,
-                                    bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"])
-            feedback_label.pack(anchor="w")
-            
-            feedback_value = tk.Label(feedback_frame, text=most_common[0], font=self.subheading_font,
-                                    bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
-            feedback_value.pack(anchor="w")
-            
-            # Add angle chart
-            chart_frame = tk.Frame(summary, bg=self.theme["bg_main"], padx=20, pady=10)
-            chart_frame.pack(fill='both', expand=True)
-            
-            chart_label = tk.Label(chart_frame, text="Angle Progression", font=self.subheading_font,
-                                 bg=self.theme["bg_main"], fg=self.theme["text_primary"])
-            chart_label.pack(anchor="w", pady=(0, 10))
-            
-            # Create figure
-            fig = plt.Figure(figsize=(5, 3), dpi=100)
-            ax = fig.add_subplot(111)
-            
-            # Sample data points to avoid overcrowding
-            sampled_angles = self.session_angles[::max(1, len(self.session_angles) // 50)]
-            ax.plot(sampled_angles, color=exercise["color"])
-            
-            # Add target range
-            ax.axhline(y=exercise["target_angles"]["ideal"], color='green', linestyle='--', alpha=0.7)
-            ax.axhspan(exercise["target_angles"]["min"], exercise["target_angles"]["max"], 
-                     alpha=0.2, color='green')
-            
-            ax.set_ylabel('Angle (degrees)')
-            ax.set_xlabel('Time')
-            ax.grid(True, alpha=0.3)
-            
-            # Add chart to frame
-            canvas = FigureCanvasTkAgg(fig, master=chart_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill='both', expand=True)
-        
-        # Add buttons
-        button_frame = tk.Frame(summary, bg=self.theme["bg_main"], padx=20, pady=20)
-        button_frame.pack(fill='x')
-        
-        close_button = tk.Button(button_frame, text="Close", font=self.normal_font,
-                               bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"], padx=15, pady=8,
-                               command=summary.destroy)
-        close_button.pack(side="right")
-        
-        new_session_button = tk.Button(button_frame, text="New Session", font=self.normal_font,
-                                     bg=self.theme["success"], fg="white", padx=15, pady=8,
-                                     command=lambda: [summary.destroy(), self.show_exercise_selection()])
-        new_session_button.pack(side="right", padx=10)
-    
-    def show_progress(self):
-        self.current_page = "progress"
-        self.clear_frame(self.content_frame)
-        
-        # Create header
-        header_frame = tk.Frame(self.content_frame, bg=self.theme["bg_main"], padx=20, pady=20)
-        header_frame.pack(fill='x')
-        
-        header_label = tk.Label(header_frame, text="Progress Tracker", font=self.heading_font,
-                              bg=self.theme["bg_main"], fg=self.theme["text_primary"])
-        header_label.pack(anchor="w")
-        
-        # Create charts frame
-        charts_frame = tk.Frame(self.content_frame, bg=self.theme["bg_main"], padx=20, pady=10)
-        charts_frame.pack(fill='both', expand=True)
-        
-        # Load activities
-        activities = self.load_recent_activities()
-        
-        if not activities:
-            no_data = tk.Label(charts_frame, text="No activity data available yet. Complete exercise sessions to see your progress.",
-                             font=self.normal_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_secondary"],
-                             padx=15, pady=30)
-            no_data.pack(fill='x', padx=5, pady=5)
-            return
-            
-        # Create exercise tabs
-        exercises = sorted(list(set([a["exercise"] for a in activities])))
-        
-        tabs_frame = tk.Frame(charts_frame, bg=self.theme["bg_main"])
-        tabs_frame.pack(fill='x')
-        
-        # Track current selected tab
-        self.selected_tab = tk.StringVar(value=exercises[0] if exercises else "")
-        
-        for exercise in exercises:
-            tab_button = tk.Button(tabs_frame, text=exercise, font=self.normal_font,
-                                 bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"],
-                                 padx=15, pady=8, bd=0,
-                                 command=lambda e=exercise: self.change_progress_tab(e))
-            tab_button.pack(side="left", padx=5, pady=5)
-        
-        # Add content frame for selected exercise
-        self.progress_content = tk.Frame(charts_frame, bg=self.theme["bg_main"])
-        self.progress_content.pack(fill='both', expand=True, pady=10)
-        
-        # Show first exercise by default
-        if exercises:
-            self.change_progress_tab(exercises[0])
-    
-    def change_progress_tab(self, exercise):
-        self.selected_tab.set(exercise)
-        self.clear_frame(self.progress_content)
-        
-        # Load activities for this exercise
-        activities = self.load_recent_activities()
-        exercise_activities = [a for a in activities if a["exercise"] == exercise]
-        
-        if not exercise_activities:
-            return
-            
-        # Create stats summary
-        stats_frame = tk.Frame(self.progress_content, bg=self.theme["bg_main"])
-        stats_frame.pack(fill='x', pady=10)
-        
-        # Total sessions
-        sessions_frame = tk.Frame(stats_frame, bg=self.theme["bg_secondary"], padx=15, pady=15)
-        sessions_frame.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
-        
-        sessions_label = tk.Label(sessions_frame, text="Total Sessions", font=self.normal_font,
-                                bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"])
-        sessions_label.pack(anchor="w")
-        
-        sessions_value = tk.Label(sessions_frame, text=str(len(exercise_activities)), font=self.subheading_font,
-                                bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
-        sessions_value.pack(anchor="w")
-        
-        # Total time
-        time_frame = tk.Frame(stats_frame, bg=self.theme["bg_secondary"], padx=15, pady=15)
-        time_frame.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
-        
-        time_label = tk.Label(time_frame, text="Total Time", font=self.normal_font,
-                            bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"])
-        time_label.pack(anchor="w")
-        
-        total_time = sum([a.get("duration", 0) for a in exercise_activities])
-        time_value = tk.Label(time_frame, text=f"{total_time} min", font=self.subheading_font,
-                            bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
-        time_value.pack(anchor="w")
-        
-        # Average performance
-        if any("performance" in a for a in exercise_activities):
-            perf_frame = tk.Frame(stats_frame, bg=self.theme["bg_secondary"], padx=15, pady=15)
-            perf_frame.grid(row=0, column=2, padx=10, pady=10, sticky="nsew")
-            
-            perf_label = tk.Label(perf_frame, text="Avg Performance", font=self.normal_font,
-                                bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"])
-            perf_label.pack(anchor="w")
-            
-            perfs = [a.get("performance", 0) for a in exercise_activities if "performance" in a]
-            avg_perf = sum(perfs) / len(perfs) if perfs else 0
-            perf_value = tk.Label(perf_frame, text=f"{int(avg_perf)}%", font=self.subheading_font,
-                                bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
-            perf_value.pack(anchor="w")
-        
-        # Create performance over time chart
-        if any("performance" in a for a in exercise_activities):
-            chart_frame = tk.Frame(self.progress_content, bg=self.theme["bg_main"], padx=15, pady=15)
-            chart_frame.pack(fill='both', expand=True)
-            
-            chart_label = tk.Label(chart_frame, text="Performance History", font=self.subheading_font,
-                                 bg=self.theme["bg_main"], fg=self.theme["text_primary"])
-            chart_label.pack(anchor="w", pady=(0, 10))
-            
-            # Create figure
-            fig = plt.Figure(figsize=(8, 4), dpi=100)
-            ax = fig.add_subplot(111)
-            
-            # Get data
-            dates = [a["date"].split()[0] for a in exercise_activities if "performance" in a]
-            performances = [a.get("performance", 0) for a in exercise_activities if "performance" in a]
-            
-            # Plot
-            if dates and performances:
-                ax.plot(dates, performances, marker='o', color=self.theme["accent"])
-                ax.set_ylabel('Performance (%)')
-                ax.set_xlabel('Date')
-                ax.grid(True, alpha=0.3)
-                
-                # Rotate date labels
-                plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
-                
-                # Add chart to frame
-                canvas = FigureCanvasTkAgg(fig, master=chart_frame)
-                canvas.draw()
-                canvas.get_tk_widget().pack(fill='both', expand=True)
-        
-        # Create recent sessions list
-        sessions_frame = tk.Frame(self.progress_content, bg=self.theme["bg_main"], padx=15, pady=15)
-        sessions_frame.pack(fill='x')
-        
-        sessions_label = tk.Label(sessions_frame, text="Recent Sessions", font=self.subheading_font,
-                                bg=self.theme["bg_main"], fg=self.theme["text_primary"])
-        sessions_label.pack(anchor="w", pady=(0, 10))
-        
-        # Create list frame
-        list_frame = tk.Frame(sessions_frame, bg=self.theme["bg_main"])
-        list_frame.pack(fill='x')
-        
-        # Headers
-        headers = ["Date", "Duration", "Performance"]
-        header_frame = tk.Frame(list_frame, bg=self.theme["bg_tertiary"])
-        header_frame.pack(fill='x')
-        
-        for i, header in enumerate(headers):
-            header_label = tk.Label(header_frame, text=header, font=self.normal_font,
-                                  bg=self.theme["bg_tertiary"], fg=self.theme["text_secondary"],
-                                  padx=15, pady=10)
-            header_label.grid(row=0, column=i, sticky="w")
-        
-        # List items
-        for i, activity in enumerate(exercise_activities[:10]):  # Show only last 10 activities
-            item_frame = tk.Frame(list_frame, bg=self.theme["bg_main"] if i % 2 == 0 else self.theme["bg_secondary"])
-            item_frame.pack(fill='x')
-            
-            date_label = tk.Label(item_frame, text=activity["date"], font=self.normal_font,
-                                bg=item_frame["bg"], fg=self.theme["text_primary"], padx=15, pady=10)
-            date_label.grid(row=0, column=0, sticky="w")
-            
-            duration_label = tk.Label(item_frame, text=f"{activity.get('duration', 0)} min", font=self.normal_font,
-                                    bg=item_frame["bg"], fg=self.theme["text_primary"], padx=15, pady=10)
-            duration_label.grid(row=0, column=1, sticky="w")
-            
-            if "performance" in activity:
-                perf_label = tk.Label(item_frame, text=f"{activity['performance']}%", font=self.normal_font,
-                                    bg=item_frame["bg"], fg=self.theme["text_primary"], padx=15, pady=10)
-                perf_label.grid(row=0, column=2, sticky="w")
-    
-    def show_settings(self):
-        self.current_page = "settings"
-        self.clear_frame(self.content_frame)
-        
-        # Create header
-        header_frame = tk.Frame(self.content_frame, bg=self.theme["bg_main"], padx=20, pady=20)
-        header_frame.pack(fill='x')
-        
-        header_label = tk.Label(header_frame, text="Settings", font=self.heading_font,
-                              bg=self.theme["bg_main"], fg=self.theme["text_primary"])
-        header_label.pack(anchor="w")
-        
-        # Create settings frame
-        settings_frame = tk.Frame(self.content_frame, bg=self.theme["bg_main"], padx=20, pady=10)
-        settings_frame.pack(fill='both')
-        
-        # User profile section
-        profile_frame = tk.Frame(settings_frame, bg=self.theme["bg_secondary"], padx=20, pady=20)
-        profile_frame.pack(fill='x', pady=10)
-        
-        profile_label = tk.Label(profile_frame, text="User Profile", font=self.subheading_font,
-                               bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
-        profile_label.pack(anchor="w", pady=(0, 10))
-        
-        # User name
-        name_frame = tk.Frame(profile_frame, bg=self.theme["bg_secondary"], pady=5)
-        name_frame.pack(fill='x')
-        
-        name_label = tk.Label(name_frame, text="Display Name:", font=self.normal_font,
-                            bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"], width=15, anchor="w")
-        name_label.pack(side="left")
-        
-        name_entry = ttk.Entry(name_frame, font=self.normal_font)
-        name_entry.insert(0, self.current_user)
-        name_entry.pack(side="left", fill='x', expand=True)
-        
-        # Save profile button
-        save_button = tk.Button(profile_frame, text="Save Profile", font=self.normal_font,
-                              bg=self.theme["accent"], fg="white", padx=15, pady=5,
-                              command=lambda: self.save_user_profile(name_entry.get()))
-        save_button.pack(anchor="e", pady=(10, 0))
-        
-        # App settings section
-        app_frame = tk.Frame(settings_frame, bg=self.theme["bg_secondary"], padx=20, pady=20)
-        app_frame.pack(fill='x', pady=10)
-        
-        app_label = tk.Label(app_frame, text="Application Settings", font=self.subheading_font,
-                           bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
-        app_label.pack(anchor="w", pady=(0, 10))
-        
-        # Dark mode toggle
-        theme_frame = tk.Frame(app_frame, bg=self.theme["bg_secondary"], pady=5)
-        theme_frame.pack(fill='x')
-        
-        theme_label = tk.Label(theme_frame, text="Dark Mode:", font=self.normal_font,
-                             bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"], width=15, anchor="w")
-        theme_label.pack(side="left")
-        
-        theme_toggle = ttk.Checkbutton(theme_frame, variable=self.dark_mode, command=self.toggle_theme)
-        theme_toggle.pack(side="left")
-        
-        # Voice feedback toggle
-        voice_frame = tk.Frame(app_frame, bg=self.theme["bg_secondary"], pady=5)
-        voice_frame.pack(fill='x')
-        
-        voice_label = tk.Label(voice_frame, text="Voice Feedback:", font=self.normal_font,
-                             bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"], width=15, anchor="w")
-        voice_label.pack(side="left")
-        
-        voice_toggle = ttk.Checkbutton(voice_frame, variable=self.use_voice_feedback)
-        voice_toggle.pack(side="left")
-        
-        # Camera settings
-        camera_frame = tk.Frame(settings_frame, bg=self.theme["bg_secondary"], padx=20, pady=20)
-        camera_frame.pack(fill='x', pady=10)
-        
-        camera_label = tk.Label(camera_frame, text="Camera Settings", font=self.subheading_font,
-                              bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
-        camera_label.pack(anchor="w", pady=(0, 10))
-        
-        # Camera selection
-        cam_frame = tk.Frame(camera_frame, bg=self.theme["bg_secondary"], pady=5)
-        cam_frame.pack(fill='x')
-        
-        cam_label = tk.Label(cam_frame, text="Camera ID:", font=self.normal_font,
-                           bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"], width=15, anchor="w")
-        cam_label.pack(side="left")
-        
-        cam_value = tk.StringVar(value=str(self.camera_id))
-        cam_entry = ttk.Entry(cam_frame, textvariable=cam_value, font=self.normal_font, width=5)
-        cam_entry.pack(side="left")
-        
-        cam_test = tk.Button(cam_frame, text="Test Camera", font=self.normal_font,
-                           bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"], padx=15, pady=5,
-                           command=lambda: self.test_camera(int(cam_value.get())))
-        cam_test.pack(side="left", padx=10)
-        
-        # Calibration button
-        calibrate_button = tk.Button(camera_frame, text="Calibrate Camera", font=self.normal_font,
-                                   bg=self.theme["accent"], fg="white", padx=15, pady=5,
-                                   command=self.start_calibration)
-        calibrate_button.pack(anchor="e", pady=(10, 0))
-        
-        # Data management section
-        data_frame = tk.Frame(settings_frame, bg=self.theme["bg_secondary"], padx=20, pady=20)
-        data_frame.pack(fill='x', pady=10)
-        
-        data_label = tk.Label(data_frame, text="Data Management", font=self.subheading_font,
-                            bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
-        data_label.pack(anchor="w", pady=(0, 10))
-        
-        # Export data button
-        export_button = tk.Button(data_frame, text="Export Exercise Data", font=self.normal_font,
-                                bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"], padx=15, pady=5,
-                                command=self.export_data)
-        export_button.pack(anchor="w")
-        
-        # Clear data button
-        clear_button = tk.Button(data_frame, text="Clear All Data", font=self.normal_font,
-                               bg=self.theme["error"], fg="white", padx=15, pady=5,
-                               command=self.clear_data)
-        clear_button.pack(anchor="w", pady=10)
-        
-        # About section
-        about_frame = tk.Frame(settings_frame, bg=self.theme["bg_secondary"], padx=20, pady=20)
-        about_frame.pack(fill='x', pady=10)
-        
-        about_label = tk.Label(about_frame, text="About", font=self.subheading_font,
-                             bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
-        about_label.pack(anchor="w", pady=(0, 10))
-        
-        version_label = tk.Label(about_frame, text="Exercise Posture Pro - Version 2.0", font=self.normal_font,
-                               bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
-        version_label.pack(anchor="w")
-        
-        desc_label = tk.Label(about_frame, text="Advanced exercise form correction system using computer vision",
-                            font=self.small_font, bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"],
-                            wraplength=600, justify="left")
-        desc_label.pack(anchor="w", pady=(5, 10))
-        
-        # Add links
-        help_button = tk.Button(about_frame, text="Help & Documentation", font=self.normal_font,
-                              bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"], padx=15, pady=5,
-                              command=lambda: webbrowser.open("https://example.com/help"))
-        help_button.pack(anchor="w")
-    
-    def test_camera(self, camera_id):
-        # Test if camera is accessible
-        try:
-            cap = cv2.VideoCapture(camera_id)
-            if not cap.isOpened():
-                messagebox.showerror("Error", f"Could not open camera ID {camera_id}")
-                return
-                
-            ret, frame = cap.read()
-            if not ret:
-                messagebox.showerror("Error", f"Could not read from camera ID {camera_id}")
-                cap.release()
-                return
-                
-            # Camera works, update setting
-            self.camera_id = camera_id
-            cap.release()
-            messagebox.showinfo("Success", f"Camera ID {camera_id} is working properly")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Error testing camera: {str(e)}")
-    
-    def start_calibration(self):
-        messagebox.showinfo("Calibration", "Camera calibration feature coming soon!")
-    
-    def export_data(self):
-        # Ask for export location
-        export_path = filedialog.asksaveasfilename(
-            defaultextension=".json",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
-            title="Export Exercise Data"
-        )
-        
-        if not export_path:
-            return
-            
-        # Export data
-        try:
-            activities = self.load_recent_activities()
-            with open(export_path, "w") as f:
-                json.dump(activities, f, indent=4)
-                
-            messagebox.showinfo("Success", f"Data exported successfully to {export_path}")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Error exporting data: {str(e)}")
-    
-    def clear_data(self):
-        # Confirm before clearing
-        confirm = messagebox.askyesno("Confirm", "Are you sure you want to clear all activity data? This cannot be undone.")
-        
-        if confirm:
-            try:
-                data_path = os.path.join(self.app_dir, "data", "activities.json")
-                if os.path.exists(data_path):
-                    os.remove(data_path)
-                    
-                messagebox.showinfo("Success", "All activity data has been cleared")
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Error clearing data: {str(e)}")
-    
-    def show_help(self):
-        self.current_page = "help"
-        self.clear_frame(self.content_frame)
-        
-        # Create header
-        header_frame = tk.Frame(self.content_frame, bg=self.theme["bg_main"], padx=20, pady=20)
-        header_frame.pack(fill='x')
-        
-        header_label = tk.Label(header_frame, text="Help & Documentation", font=self.heading_font,
-                              bg=self.theme["bg_main"], fg=self.theme["text_primary"])
-        header_label.pack(anchor="w")
-        
-        # Create help content
-        help_frame = tk.Frame(self.content_frame, bg=self.theme["bg_main"], padx=20, pady=10)
-        help_frame.pack(fill='both', expand=True)
-        
-        # Getting started section
-        start_frame = tk.Frame(help_frame, bg=self.theme["bg_secondary"], padx=20, pady=20)
-        start_frame.pack(fill='x', pady=10)
-        
-        start_label = tk.Label(start_frame, text="Getting Started", font=self.subheading_font,
-                             bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
-        start_label.pack(anchor="w", pady=(0, 10))
-        
-        steps = [
-            "1. Select an exercise from the Dashboard or Exercise Selection page",
-            "2. Position yourself in front of the camera so your full body is visible",
-            "3. Click 'Start Camera' to begin exercise tracking",
-            "4. Follow the on-screen feedback to improve your form",
-            "5. Complete your exercise session and view your performance summary"
-        ]
-        
-        for step in steps:
-            step_label = tk.Label(start_frame, text=step, font=self.normal_font,
-                                bg=self.theme["bg_secondary"], fg=self.theme["text_primary"],
-                                wraplength=800, justify="left")
-            step_label.pack(anchor="w", pady=5)
-        
-        # Exercise guide section
-        guide_frame = tk.Frame(help_frame, bg=self.theme["bg_secondary"], padx=20, pady=20)
-        guide_frame.pack(fill='x', pady=10)
-        
-        guide_label = tk.Label(guide_frame, text="Exercise Guide", font=self.subheading_font,
-                             bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
-        guide_label.pack(anchor="w", pady=(0, 10))
-        
-        exercises = [
-            "Bicep Curl - Stand with arms extended, bend at the elbow to lift weights toward shoulders",
-            "Push-up - Start in plank position, lower body until elbows reach 90°, then push back up",
-            "Squat - Stand with feet shoulder-width apart, bend knees to lower body, keep back straight",
-            "Shoulder Press - Start with weights at shoulder height, push directly upward until arms extend"
-        ]
-        
-        for ex in exercises:
-            ex_label = tk.Label(guide_frame, text=ex, font=self.normal_font,
-                              bg=self.theme["bg_secondary"], fg=self.theme["text_primary"],
-                              wraplength=800, justify="left")
-            ex_label.pack(anchor="w", pady=5)
-        
-        # Troubleshooting section
-        trouble_frame = tk.Frame(help_frame, bg=self.theme["bg_secondary"], padx=20, pady=20)
-        trouble_frame.pack(fill='x', pady=10)
-        
-        trouble_label = tk.Label(trouble_frame, text="Troubleshooting", font=self.subheading_font,
-                               bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
-        trouble_label.pack(anchor="w", pady=(0, 10))
-        
-        issues = [
-            "Camera not working - Check camera ID in Settings and ensure no other application is using the camera",
-            "Poor pose detection - Ensure good lighting and that your full body is visible in the frame",
-            "Inaccurate angle measurement - Try the camera calibration feature in Settings",
-            "Application running slowly - Close other applications that might be using system resources"
-        ]
-        
-        for issue in issues:
-            issue_label = tk.Label(trouble_frame, text=issue, font=self.normal_font,
-                                 bg=self.theme["bg_secondary"], fg=self.theme["text_primary"],
-                                 wraplength=800, justify="left")
-            issue_label.pack(anchor="w", pady=5)
-        
-        # Contact section
-        contact_frame = tk.Frame(help_frame, bg=self.theme["bg_secondary"], padx=20, pady=20)
-        contact_frame.pack(fill='x', pady=10)
-        
-        contact_label = tk.Label(contact_frame, text="Contact & Support", font=self.subheading_font,
-                               bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
-        contact_label.pack(anchor="w", pady=(0, 10))
-        
-        email_label = tk.Label(contact_frame, text="For support, email: support@exerciseposturepro.com",
-                             font=self.normal_font, bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
-        email_label.pack(anchor="w", pady=5)
-        
-        website_label = tk.Label(contact_frame, text="Visit our website: www.exerciseposturepro.com",
-                               font=self.normal_font, bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
-        website_label.pack(anchor="w", pady=5)
-    
-    def save_user_profile(self, name):
-        if name.strip():
-            self.current_user = name.strip()
-            
-            # Save user profile
-            with open(os.path.join(self.app_dir, "profiles", "user.json"), "w") as f:
-                json.dump({"name": self.current_user}, f)
-                
-            messagebox.showinfo("Success", "User profile saved successfully")
-            
-            # Update dashboard
-            if self.current_page == "dashboard":
-                self.show_dashboard()
-    
-    def load_user_data(self):
-        # Load user profile
-        try:
-            profile_path = os.path.join(self.app_dir, "profiles", "user.json")
-            if os.path.exists(profile_path):
-                with open(profile_path, "r") as f:
-                    profile = json.load(f)
-                    self.current_user = profile.get("name", "Default User")
-        except:
-            pass
-    
-    def load_recent_activities(self):
-        try:
-            activities_path = os.path.join(self.app_dir, "data", "activities.json")
-            if os.path.exists(activities_path):
-                with open(activities_path, "r") as f:
-                    return json.load(f)
-        except:
-            pass
-        return []
-    
-    def calculate_angle(self, a, b, c):
-        a = np.array(a)
-        b = np.array(b)
-        c = np.array(c)
-        radians = np.arctan2(c[1] - b[1], c[0] - b[0]) - np.arctan2(a[1] - b[1], a[0] - b[0])
-        angle = np.abs(radians * 180.0 / np.pi)
-        if angle > 180.0:
-            angle = 360 - angle
-        return angle
-
-# Main entry point
-if __name__ == "__main__":
-    root = tk.Tk()
-    app = ExercisePoseApp(root)
+import tkinter as tk
+from tkinter import ttk, messagebox, PhotoImage, Canvas, filedialog, StringVar, BooleanVar
+import tkinter.font as tkFont
+import threading
+import concurrent.futures
+import contextlib
+import heapq
+import numpy as np
+import os
+import json
+import datetime
+import time
+import math
+from collections import Counter, deque
+from functools import partial
+import webbrowser
+import sys
+import random
+import platform
+
+# Heavy CV/ML dependencies are imported lazily in the background so the
+# window appears immediately instead of waiting several seconds on imports
+cv2 = None
+Image = None
+ImageTk = None
+YOLO = None
+mp = None
+
+def import_heavy_modules():
+    # Import (installing if missing) the heavy dependencies and publish them
+    # as module globals; called once from the background resource loader
+    global cv2, Image, ImageTk, YOLO, mp
+    import cv2 as cv2_mod
+    from PIL import Image as image_mod, ImageTk as imagetk_mod
+    try:
+        from ultralytics import YOLO as yolo_cls
+        import mediapipe as mp_mod
+    except ImportError:
+        print("Required packages not found. Installing...")
+        import subprocess
+        subprocess.check_call([sys.executable, "-m", "pip", "install",
+                              "ultralytics", "mediapipe", "pillow", "matplotlib"])
+        from ultralytics import YOLO as yolo_cls
+        import mediapipe as mp_mod
+    cv2 = cv2_mod
+    Image = image_mod
+    ImageTk = imagetk_mod
+    YOLO = yolo_cls
+    mp = mp_mod
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; stdlib json is the fallback
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the kernels run as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        def wrap(func):
+            return func
+        return wrap
+
+@njit(cache=True, fastmath=True)
+def compute_angle(ax, ay, bx, by, cx, cy):
+    # Angle at vertex b (degrees) between points a-b-c
+    v1x = ax - bx
+    v1y = ay - by
+    v2x = cx - bx
+    v2y = cy - by
+    dot = v1x * v2x + v1y * v2y
+    n1 = math.sqrt(v1x * v1x + v1y * v1y)
+    n2 = math.sqrt(v2x * v2x + v2y * v2y)
+    return math.degrees(math.acos(max(-1.0, min(1.0, dot / (n1 * n2 + 1e-9)))))
+
+@njit(cache=True, fastmath=True)
+def compute_all_angles(landmarks, triples):
+    # Batched form: landmarks is (33, 2), triples is (N, 3) joint indices
+    out = np.empty(triples.shape[0], dtype=np.float32)
+    for i in range(triples.shape[0]):
+        a, b, c = triples[i, 0], triples[i, 1], triples[i, 2]
+        out[i] = compute_angle(landmarks[a, 0], landmarks[a, 1],
+                               landmarks[b, 0], landmarks[b, 1],
+                               landmarks[c, 0], landmarks[c, 1])
+    return out
+
+@njit(cache=True, fastmath=True)
+def perf_score(angles, target, max_dev):
+    # Fraction of ideal form over a session: mean deviation from the
+    # target angle, capped at 1, inverted
+    dev = np.minimum(1.0, np.abs(angles - target) / max_dev)
+    return 1.0 - dev.mean()
+
+class RepStateMachine:
+    """Counts reps for one exercise from the smoothed angle stream.
+
+    A rep completes on a direction reversal (count_dir: +1 up, -1 down)
+    while the previous angle sits past the count threshold; the detector
+    re-arms once the angle crosses back past the reset threshold. This is
+    the same prev/current direction logic the camera loop used to repeat
+    in four copy-pasted ladders, reduced to plain numeric comparisons.
+    """
+
+    __slots__ = ("count_dir", "count_low", "count_thr", "reset_low",
+                 "reset_thr", "prev_angle", "direction", "counted")
+
+    def __init__(self, count_dir, count_low, count_thr, reset_low, reset_thr):
+        self.count_dir = count_dir
+        self.count_low = count_low
+        self.count_thr = count_thr
+        self.reset_low = reset_low
+        self.reset_thr = reset_thr
+        self.reset()
+
+    def reset(self):
+        self.prev_angle = None
+        self.direction = 0
+        self.counted = False
+
+    def step(self, angle):
+        if self.prev_angle is None:
+            self.prev_angle = angle
+            return False
+        direction = 1 if angle > self.prev_angle else -1
+        hit = False
+        past_count = (self.prev_angle < self.count_thr if self.count_low
+                      else self.prev_angle > self.count_thr)
+        if self.direction == -self.count_dir and direction == self.count_dir and past_count:
+            if not self.counted:
+                self.counted = True
+                hit = True
+        elif (angle < self.reset_thr if self.reset_low
+              else angle > self.reset_thr):
+            self.counted = False
+        self.direction = direction
+        self.prev_angle = angle
+        return hit
+
+
+class ExercisePoseApp:
+    def __init__(self, root):
+        self.root = root
+        self.setup_window()
+        self.initialize_variables()
+        self.create_styles()
+        self.create_main_frame()
+        self.show_dashboard()
+        self.load_user_data()
+        # Import the CV/ML stack and load models off the main thread so the
+        # window is interactive while they warm up
+        threading.Thread(target=self.load_resources, daemon=True).start()
+        
+    def setup_window(self):
+        self.root.title("Advanced Exercise Posture Assistant")
+        self.root.configure(bg="#121212")
+        self.screen_width = self.root.winfo_screenwidth()
+        self.screen_height = self.root.winfo_screenheight()
+        app_width = min(1280, int(self.screen_width * 0.9))
+        app_height = min(800, int(self.screen_height * 0.9))
+        self.root.geometry(f"{app_width}x{app_height}")
+        self.root.minsize(960, 600)
+        
+        # Make app responsive
+        self.root.columnconfigure(0, weight=1)
+        self.root.rowconfigure(0, weight=1)
+        
+        # Set app icon if OS is not macOS (which handles icons differently)
+        if platform.system() != "Darwin":
+            try:
+                self.root.iconbitmap("app_icon.ico")
+            except:
+                pass
+    
+    def load_resources(self):
+        # Runs on a worker thread: pull in the heavy dependencies, then load
+        # and warm up the models while the UI stays responsive
+        import_heavy_modules()
+
+        # Let OpenCV dispatch resize/color-convert to OpenCL (iGPU) when the
+        # platform supports it, freeing CPU cycles for the pose model
+        self.use_opencl = False
+        try:
+            if cv2.ocl.haveOpenCL():
+                cv2.ocl.setUseOpenCL(True)
+                self.use_opencl = cv2.ocl.useOpenCL()
+        except Exception:
+            pass
+
+        # Pick the best device for YOLO inference (GPU with FP16 when available)
+        try:
+            import torch
+            self.device = 'cuda' if torch.cuda.is_available() else 'cpu'
+        except ImportError:
+            self.device = 'cpu'
+        self.use_half = self.device == 'cuda'
+
+        # Load YOLO model
+        try:
+            model_path = os.path.join(self.app_dir, "best.pt")
+            if os.path.exists(model_path):
+                self.model = YOLO(model_path).to(self.device)
+            else:
+                # Use default model
+                self.model = YOLO("best.pt").to(self.device)
+            # Warm up once so the first real frame doesn't pay graph/kernel init cost
+            self.model.predict(np.zeros((640, 640, 3), dtype=np.uint8), device=self.device,
+                               half=self.use_half, imgsz=640, verbose=False)
+        except Exception as e:
+            self.model = None
+            print(f"Error loading model: {e}")
+
+        # Without a GPU, a compiled ONNX graph avoids PyTorch's per-call overhead
+        self.ort_session = None
+        if self.model is not None and self.device == 'cpu':
+            self.setup_onnx_session()
+
+        # Quantized INT8 weights beat both CPU paths when OpenVINO is around
+        if self.model is not None and self.device == 'cpu' and self.use_int8.get():
+            self.setup_int8_model()
+
+        # Warm up the JIT-compiled angle kernels here so the first rep of a
+        # session isn't stalled by compilation
+        compute_all_angles(np.zeros((33, 2), dtype=np.float32),
+                           np.array([[11, 13, 15]], dtype=np.int64))
+        perf_score(np.zeros(4, dtype=np.float32), 90.0, 45.0)
+
+        # PIL display view is created here because PIL itself loads lazily
+        self._pil_img = Image.frombuffer('RGBA', (self.canvas_width, self.canvas_height),
+                                         self._display_buf, 'raw', 'RGBA', 0, 1)
+        self._pil_img.readonly = 0
+
+        # MediaPipe setup - default to the lite landmark model, which roughly
+        # halves per-frame CPU cost; Settings offers a high-accuracy toggle
+        self.mp_pose = mp.solutions.pose
+        self.pose = self.create_pose_estimator()
+        self.mp_drawing = mp.solutions.drawing_utils
+        self.drawing_spec = self.mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=2)
+        # Connection pairs as one int32 array so the skeleton can be drawn
+        # in a single batched pass instead of mp_drawing's per-line loop
+        self._connections = np.array(list(self.mp_pose.POSE_CONNECTIONS), dtype=np.int32)
+
+        self.models_ready = True
+        
+    def create_pose_estimator(self):
+        if self.high_accuracy.get():
+            return self.mp_pose.Pose(
+                static_image_mode=False,
+                model_complexity=1,
+                enable_segmentation=False,
+                smooth_landmarks=True,
+                min_detection_confidence=0.7,
+                min_tracking_confidence=0.7
+            )
+        return self.mp_pose.Pose(
+            static_image_mode=False,
+            model_complexity=0,
+            enable_segmentation=False,
+            smooth_landmarks=True,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5
+        )
+
+    def toggle_accuracy_mode(self):
+        # Swap the pose estimator to match the selected accuracy/FPS trade-off.
+        # While the camera runs the worker may be inside pose.process(), so
+        # closing the estimator here would race it; let the processing loop
+        # perform the swap between frames instead
+        if self.pose is None:
+            return
+        if self.camera_active:
+            self._pose_swap_pending = True
+            return
+        old_pose = self.pose
+        self.pose = self.create_pose_estimator()
+        try:
+            old_pose.close()
+        except Exception:
+            pass
+
+    def initialize_variables(self):
+        # Prepare data directory
+        self.app_dir = os.path.join(os.path.expanduser("~"), "ExercisePoseApp")
+        os.makedirs(self.app_dir, exist_ok=True)
+        os.makedirs(os.path.join(self.app_dir, "data"), exist_ok=True)
+        os.makedirs(os.path.join(self.app_dir, "profiles"), exist_ok=True)
+
+        # Load exercise data
+        self.exercise_data = {
+            "bicep curl": {
+                "name": "Bicep Curl",
+                "description": "Trains biceps by flexing at the elbow",
+                "keypoints": [11, 13, 15],  # shoulder, elbow, wrist
+                "target_angles": {"min": 30, "max": 160, "ideal": 90},
+                "level": "beginner",
+                "muscles": ["Biceps", "Forearms"],
+                "color": "#2980b9",
+                "feedback": {
+                    "too_extended": "Bend your arm more",
+                    "too_flexed": "Extend your arm more",
+                    "good": "Good form! Keep going",
+                    "complete": "Curl complete. Great job!"
+                }
+            },
+            "push-up": {
+                "name": "Push-Up",
+                "description": "Full body exercise focusing on chest and arms",
+                "keypoints": [11, 13, 15, 23, 25, 27],  # various upper body points
+                "target_angles": {"min": 80, "max": 160, "ideal": 90},
+                "level": "intermediate",
+                "muscles": ["Chest", "Shoulders", "Triceps", "Core"],
+                "color": "#27ae60",
+                "feedback": {
+                    "too_high": "Lower your body more",
+                    "too_low": "Push up more",
+                    "back_bent": "Keep your back straight",
+                    "good": "Good form! Keep your core tight"
+                }
+            },
+            "squat": {
+                "name": "Squat",
+                "description": "Lower body exercise for legs and glutes",
+                "keypoints": [23, 25, 27],  # hip, knee, ankle
+                "target_angles": {"min": 70, "max": 170, "ideal": 110},
+                "level": "intermediate",
+                "muscles": ["Quadriceps", "Hamstrings", "Glutes", "Core"],
+                "color": "#f39c12",
+                "feedback": {
+                    "too_high": "Squat deeper",
+                    "too_low": "Rise up more",
+                    "knees_forward": "Keep knees behind toes",
+                    "good": "Great depth! Keep chest up"
+                }
+            },
+            "shoulder press": {
+                "name": "Shoulder Press",
+                "description": "Upper body exercise targeting shoulders",
+                "keypoints": [11, 13, 15],  # shoulder, elbow, wrist
+                "target_angles": {"min": 60, "max": 170, "ideal": 160},
+                "level": "advanced",
+                "muscles": ["Shoulders", "Triceps", "Upper Back"],
+                "color": "#8e44ad",
+                "feedback": {
+                    "too_low": "Push higher",
+                    "elbows_out": "Keep elbows forward",
+                    "good": "Good form! Keep pushing",
+                    "locked_out": "Great lockout position"
+                }
+            }
+        }
+
+        # Structure-of-arrays view of the per-exercise hot-path data so the
+        # camera loop does array indexing instead of nested dict lookups
+        self._ex_ids = {key: i for i, key in enumerate(self.exercise_data)}
+        exercises = list(self.exercise_data.values())
+        max_kp = max(len(e["keypoints"]) for e in exercises)
+        self._kp = np.array([e["keypoints"] + [-1] * (max_kp - len(e["keypoints"]))
+                             for e in exercises], dtype=np.int32)
+        self._target_min = np.array([e["target_angles"]["min"] for e in exercises], dtype=np.float32)
+        self._target_max = np.array([e["target_angles"]["max"] for e in exercises], dtype=np.float32)
+        self._target_ideal = np.array([e["target_angles"]["ideal"] for e in exercises], dtype=np.float32)
+
+        # Models are populated by the background loader
+        self.model = None
+        self.pose = None
+        self.models_ready = False
+        self.high_accuracy = BooleanVar(value=False)
+        self.use_int8 = BooleanVar(value=True)
+        self.int8_active = False
+
+        self.camera_active = False
+        self.camera_id = 0
+        self.cap = None
+        # Frame handoff between the capture and processing threads
+        self._frame_lock = threading.Lock()
+        self._cap_stop = threading.Event()
+        self._slot_fresh = False
+        self.current_exercise = None
+        # Person detection changes slowly vs. the 30 FPS stream, so YOLO only
+        # runs every N-th frame and the last result is reused in between
+        self.yolo_every = 5
+        self._frame_counter = 0
+        self._last_detections = None
+        # Small pool so detection can overlap pose inference on each frame
+        self._infer_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        # Separate pool for disk I/O so exports never block the Tk loop or
+        # contend with inference
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        # Fixed-size circular buffer + running sum for O(1) angle smoothing
+        self._ang_buf = np.zeros(10, dtype=np.float32)
+        self._ang_idx = 0
+        self._ang_sum = 0.0
+        self._ang_count = 0
+        self.prev_hip_y = None
+        self.session_start_time = None
+        self.session_reps = 0
+        # Capped preallocated store for the session's smoothed angles
+        # (an hour at 60 FPS); worker appends by index, analysis slices it
+        self.session_angles = np.empty(60 * 60 * 60, dtype=np.float32)
+        self._sa_n = 0
+        self.session_feedback = []
+        self.use_voice_feedback = BooleanVar(value=False)
+        self.show_skeleton = BooleanVar(value=True)
+        self.show_angles = BooleanVar(value=True)
+        # Plain-bool mirrors of the Tk variables; each .get() is a round
+        # trip into the Tcl interpreter, which the worker thread should not
+        # pay per frame (and Tk variables are not thread-safe anyway)
+        self._show_skeleton = True
+        self._show_angles = True
+        self.show_skeleton.trace_add(
+            "write", lambda *_: setattr(self, "_show_skeleton", self.show_skeleton.get()))
+        self.show_angles.trace_add(
+            "write", lambda *_: setattr(self, "_show_angles", self.show_angles.get()))
+        self.camera_frame = None
+        self.processed_frame = None
+        self.canvas_width = 640
+        self.canvas_height = 480
+        # Reusable per-frame buffers so resize/color-convert never reallocate
+        # (a fresh 640x480 frame buffer is ~1MB of allocator churn per frame).
+        # RGBA rather than RGB because PIL's frombuffer only shares memory
+        # for 32-bit-pixel modes; RGB would silently copy
+        self._rgba_buf = np.empty((self.canvas_height, self.canvas_width, 4), dtype=np.uint8)
+        # Smaller frame fed to the pose model; both models resample internally
+        # anyway, so shrinking the input just cuts memory traffic
+        self.infer_width = 256
+        self.infer_height = 192
+        self._infer_buf = np.empty((self.infer_height, self.infer_width, 3), dtype=np.uint8)
+        # Triple-buffered (raw, display, pose-RGB) sets: capture fills the
+        # write set and swaps it into the slot; processing swaps the slot
+        # into its read set. Neither side copies and frames never tear.
+        display_shape = (self.canvas_height, self.canvas_width, 3)
+        infer_shape = (self.infer_height, self.infer_width, 3)
+        self._buf_write = [None, np.empty(display_shape, np.uint8), np.empty(infer_shape, np.uint8)]
+        self._buf_slot = [None, np.empty(display_shape, np.uint8), np.empty(infer_shape, np.uint8)]
+        self._buf_read = [None, np.empty(display_shape, np.uint8), np.empty(infer_shape, np.uint8)]
+        # Double buffer handing processed frames to the Tk-side render tick
+        self._display_lock = threading.Lock()
+        self._display_buf = np.empty_like(self._rgba_buf)
+        self._display_new = False
+        # Zero-copy PIL view over the display buffer (built by the loader
+        # once PIL is imported); pasted into one long-lived PhotoImage
+        self._pil_img = None
+        self._tk_img = None
+        self._canvas_item = None
+        self._lm_scale = np.array([self.canvas_width, self.canvas_height], dtype=np.float32)
+        # Per-exercise rep detectors; thresholds are fixed at startup from
+        # the target angles so the hot loop does no string dispatch
+        self._rep_fsm = {}
+        for name, data in self.exercise_data.items():
+            t = data["target_angles"]
+            if name == "bicep curl":
+                fsm = RepStateMachine(1, True, t["min"] + 10, False, t["max"] - 20)
+            elif name == "shoulder press":
+                fsm = RepStateMachine(1, False, t["max"] - 10, True, t["min"] + 10)
+            else:
+                # push-up and squat both count the reversal at the top
+                fsm = RepStateMachine(-1, False, t["max"] - 20, True, t["min"] + 20)
+            self._rep_fsm[name] = fsm
+        # Parsed activity log, invalidated by file mtime
+        self._activities_cache = None
+        self._activities_mtime = None
+        # Progress chart reused across page builds and tab switches
+        self._prog_fig = None
+        self._prog_ax = None
+        self._prog_line = None
+        self._prog_canvas = None
+        # Cached matplotlib figure for the session summary popup
+        self._summary_fig = None
+        self._summary_ax = None
+        # Static-scene gate state for skipping pose inference
+        self._prev_gray = None
+        self._last_pose_results = None
+        self._last_pose_t = 0.0
+        self._person_present = True
+        self._pose_swap_pending = False
+        self.target_fps = 30
+        self._delay_hist = deque(maxlen=30)
+        # Label updates coalesced from worker threads into one Tk batch
+        self._ui_lock = threading.Lock()
+        self._pending_ui = {}
+        self._ui_last = {}
+        self.current_user = "Default User"
+        self.dark_mode = BooleanVar(value=True)
+        self.calibration_mode = False
+        self.calibration_points = []
+        # Cached page frames swapped in/out on navigation instead of being
+        # destroyed and rebuilt widget by widget
+        self._pages = {}
+        self._current_page_frame = None
+        
+        # Widget -> {color option: theme role} registry; theme flips restyle
+        # exactly these widgets and leave every other color alone
+        self._themed_widgets = {}
+
+        # Create a dictionary to store theme colors
+        self.update_theme_colors()
+        
+    def update_theme_colors(self):
+        if self.dark_mode.get():
+            self.theme = {
+                "bg_main": "#121212",
+                "bg_secondary": "#1e1e1e",
+                "bg_tertiary": "#2d2d2d",
+                "text_primary": "#ffffff",
+                "text_secondary": "#bbbbbb",
+                "accent": "#8e44ad",
+                "highlight": "#f39c12",
+                "success": "#27ae60",
+                "warning": "#e67e22",
+                "error": "#e74c3c",
+                "shadow": "black"
+            }
+        else:
+            self.theme = {
+                "bg_main": "#f5f5f5",
+                "bg_secondary": "#ffffff",
+                "bg_tertiary": "#e0e0e0",
+                "text_primary": "#212121",
+                "text_secondary": "#757575",
+                "accent": "#9c27b0",
+                "highlight": "#f39c12",
+                "success": "#2ecc71",
+                "warning": "#f39c12",
+                "error": "#e74c3c",
+                "shadow": "#bbbbbb"
+            }
+
+        # Feedback string -> resolved label colour, so the camera loop does
+        # a single dict get instead of substring tests plus theme lookups
+        feedback_strings = ("Extend more", "Curl Complete", "Good Form",
+                            "Keep body straight", "Adjust your posture",
+                            "Too Low", "Stand Up Straight", "Good Squat",
+                            "Locked Out", "Push Higher", "No feedback available",
+                            "No person detected")
+        self._fb_color = {
+            fb: (self.theme["success"] if "Good" in fb else
+                 self.theme["warning"] if "Complete" in fb else
+                 self.theme["error"])
+            for fb in feedback_strings
+        }
+
+    def create_styles(self):
+        # Create custom fonts once; the Font objects are shared everywhere
+        self.title_font = tkFont.Font(family="Helvetica", size=24, weight="bold")
+        self.heading_font = tkFont.Font(family="Helvetica", size=18, weight="bold")
+        self.subheading_font = tkFont.Font(family="Helvetica", size=14, weight="bold")
+        self.normal_font = tkFont.Font(family="Helvetica", size=12)
+        self.small_font = tkFont.Font(family="Helvetica", size=10)
+
+        self.style = ttk.Style()
+        self.restyle_ttk()
+
+    def restyle_ttk(self):
+        # Configure ttk styles for the current theme
+        self.style.configure("TFrame", background=self.theme["bg_main"])
+        self.style.configure("TLabel", background=self.theme["bg_main"], foreground=self.theme["text_primary"])
+        self.style.configure("TButton", font=self.normal_font, padding=10)
+        
+        # Custom button styles
+        self.style.configure("Primary.TButton", background=self.theme["accent"], foreground="white")
+        self.style.configure("Secondary.TButton", background=self.theme["bg_tertiary"], foreground=self.theme["text_primary"])
+        self.style.configure("Success.TButton", background=self.theme["success"], foreground="white")
+        self.style.configure("Warning.TButton", background=self.theme["warning"], foreground="white")
+        self.style.configure("Danger.TButton", background=self.theme["error"], foreground="white")
+        
+        # Configure progress bar style
+        self.style.configure("TProgressbar", thickness=15, background=self.theme["accent"])
+    
+    def create_main_frame(self):
+        self.main_frame = ttk.Frame(self.root)
+        self.main_frame.grid(row=0, column=0, sticky="nsew")
+        self.main_frame.columnconfigure(0, weight=1)
+        self.main_frame.rowconfigure(0, weight=1)
+        
+        # Create navigation frame
+        self.nav_frame = tk.Frame(self.main_frame, bg=self.theme["bg_secondary"], width=200)
+        self._register_themed(self.nav_frame, bg="bg_secondary")
+        self.nav_frame.grid(row=0, column=0, sticky="nsw", padx=0, pady=0)
+        
+        # Create app title
+        title_frame = tk.Frame(self.nav_frame, bg=self.theme["accent"], padx=10, pady=20)
+        self._register_themed(title_frame, bg="accent")
+        title_frame.pack(fill='x')
+        
+        title_label = tk.Label(title_frame, text="Exercise\nPosture Pro", font=self.title_font, 
+                              bg=self.theme["accent"], fg="white")
+        self._register_themed(title_label, bg="accent")
+        title_label.pack(pady=5)
+        
+        # Create navigation buttons
+        self.create_nav_button("Dashboard", self.show_dashboard)
+        self.create_nav_button("Start Exercise", self.show_exercise_selection)
+        self.create_nav_button("Progress Tracker", self.show_progress)
+        self.create_nav_button("Settings", self.show_settings)
+        self.create_nav_button("Help", self.show_help)
+        
+        # Add app version and theme toggle at bottom
+        version_frame = tk.Frame(self.nav_frame, bg=self.theme["bg_secondary"], padx=10, pady=10)
+        self._register_themed(version_frame, bg="bg_secondary")
+        version_frame.pack(side="bottom", fill='x')
+        
+        version_label = tk.Label(version_frame, text="Version 2.0", font=self.small_font, 
+                                bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"])
+        self._register_themed(version_label, bg="bg_secondary", fg="text_secondary")
+        version_label.pack(side="left", pady=5)
+        
+        theme_toggle = ttk.Checkbutton(version_frame, text="", variable=self.dark_mode, 
+                                    command=self.toggle_theme, style="Switch.TCheckbutton")
+        theme_toggle.pack(side="right", pady=5)
+        
+        # Create content frame (where different pages will be shown)
+        self.content_frame = tk.Frame(self.main_frame, bg=self.theme["bg_main"])
+        self._register_themed(self.content_frame, bg="bg_main")
+        self.content_frame.grid(row=0, column=1, sticky="nsew", padx=0, pady=0)
+        self.main_frame.columnconfigure(1, weight=4)  # Content takes most space
+        
+    def create_nav_button(self, text, command):
+        button_frame = tk.Frame(self.nav_frame, bg=self.theme["bg_secondary"])
+        self._register_themed(button_frame, bg="bg_secondary")
+        button_frame.pack(fill='x')
+        
+        button = tk.Button(button_frame, text=text, font=self.normal_font,
+                         bg=self.theme["bg_secondary"], fg=self.theme["text_primary"],
+                         activebackground=self.theme["accent"], activeforeground="white",
+                         bd=0, padx=20, pady=15, anchor="w", width=20,
+                         command=command)
+        self._register_themed(button, bg="bg_secondary", fg="text_primary", activebackground="accent")
+        button.pack(fill='x')
+    
+    def toggle_theme(self):
+        # Remap widget colors in place rather than tearing down and
+        # recreating the current page (which would also drop camera state)
+        self.update_theme_colors()
+        self.restyle_ttk()
+        self.retheme_widgets()
+        self._apply_chart_theme()
+
+    def _apply_chart_theme(self):
+        # Restyle the persistent progress figure in place; matplotlib
+        # artists take new colors without rebuilding figure or canvas
+        if self._prog_fig is None:
+            return
+        fg = self.theme["text_primary"]
+        self._prog_fig.set_facecolor(self.theme["bg_main"])
+        self._prog_ax.set_facecolor(self.theme["bg_secondary"])
+        self._prog_ax.tick_params(colors=fg)
+        self._prog_ax.xaxis.label.set_color(fg)
+        self._prog_ax.yaxis.label.set_color(fg)
+        self._prog_line.set_color(self.theme["accent"])
+        if self._prog_canvas is not None:
+            self._prog_canvas.draw_idle()
+
+    def _register_themed(self, widget, **roles):
+        # Record which theme role each color option was drawn from, so a
+        # theme flip can restyle the widget by role instead of guessing
+        # from color values (which collides with exercise accent colors)
+        self._themed_widgets[widget] = roles
+
+    def retheme_widgets(self):
+        # Reapply registered roles in place; widgets never registered
+        # (exercise accents etc.) keep their colors, and entries whose
+        # widgets have been destroyed are dropped as they are found
+        dead = []
+        for widget, roles in self._themed_widgets.items():
+            if not widget.winfo_exists():
+                dead.append(widget)
+                continue
+            widget.configure({opt: self.theme[role]
+                              for opt, role in roles.items()})
+        for widget in dead:
+            del self._themed_widgets[widget]
+    
+    def create_dashboard(self, parent):
+        # Create welcome header
+        welcome_frame = tk.Frame(parent, bg=self.theme["bg_main"], padx=20, pady=20)
+        self._register_themed(welcome_frame, bg="bg_main")
+        welcome_frame.pack(fill='x')
+        
+        welcome_label = tk.Label(welcome_frame, text=f"Welcome, {self.current_user}",
+                                font=self.heading_font, bg=self.theme["bg_main"], fg=self.theme["text_primary"])
+        self._register_themed(welcome_label, bg="bg_main", fg="text_primary")
+        welcome_label.pack(anchor="w")
+        
+        date_label = tk.Label(welcome_frame, text=datetime.datetime.now().strftime("%A, %B %d, %Y"),
+                            font=self.normal_font, bg=self.theme["bg_main"], fg=self.theme["text_secondary"])
+        self._register_themed(date_label, bg="bg_main", fg="text_secondary")
+        date_label.pack(anchor="w")
+        
+        # Create quick start section
+        quick_start_frame = tk.Frame(parent, bg=self.theme["bg_main"], padx=20, pady=10)
+        self._register_themed(quick_start_frame, bg="bg_main")
+        quick_start_frame.pack(fill='x')
+        
+        quick_start_label = tk.Label(quick_start_frame, text="Quick Start Exercise",
+                                   font=self.subheading_font, bg=self.theme["bg_main"], fg=self.theme["text_primary"])
+        self._register_themed(quick_start_label, bg="bg_main", fg="text_primary")
+        quick_start_label.pack(anchor="w", pady=(0, 10))
+        
+        # Create grid for exercise cards
+        exercise_grid = tk.Frame(quick_start_frame, bg=self.theme["bg_main"])
+        self._register_themed(exercise_grid, bg="bg_main")
+        exercise_grid.pack(fill='x')
+        
+        # Create exercise cards
+        col = 0
+        for exercise_key, exercise_info in self.exercise_data.items():
+            self.create_exercise_card(exercise_grid, exercise_key, col)
+            col += 1
+        
+        # Create recent activity section
+        recent_frame = tk.Frame(parent, bg=self.theme["bg_main"], padx=20, pady=10)
+        self._register_themed(recent_frame, bg="bg_main")
+        recent_frame.pack(fill='x', pady=20)
+        
+        recent_label = tk.Label(recent_frame, text="Recent Activity",
+                             font=self.subheading_font, bg=self.theme["bg_main"], fg=self.theme["text_primary"])
+        self._register_themed(recent_label, bg="bg_main", fg="text_primary")
+        recent_label.pack(anchor="w", pady=(0, 10))
+        
+        # Create empty state or load recent activities
+        recent_activities = self.load_recent_activities()
+        if recent_activities:
+            for activity in recent_activities[:3]:  # Show only last 3 activities
+                self.create_activity_item(recent_frame, activity)
+        else:
+            no_activity = tk.Label(recent_frame, text="No recent activities. Start exercising to track your progress!",
+                                 font=self.normal_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_secondary"],
+                                 padx=15, pady=30)
+            self._register_themed(no_activity, bg="bg_tertiary", fg="text_secondary")
+            no_activity.pack(fill='x', padx=5, pady=5)
+        
+        # Create tips section
+        tips_frame = tk.Frame(parent, bg=self.theme["bg_main"], padx=20, pady=10)
+        self._register_themed(tips_frame, bg="bg_main")
+        tips_frame.pack(fill='x', pady=10)
+        
+        tips_label = tk.Label(tips_frame, text="Exercise Tips",
+                           font=self.subheading_font, bg=self.theme["bg_main"], fg=self.theme["text_primary"])
+        self._register_themed(tips_label, bg="bg_main", fg="text_primary")
+        tips_label.pack(anchor="w", pady=(0, 10))
+        
+        tips = [
+            "Remember to warm up before starting any exercise",
+            "Stay hydrated during your workout sessions",
+            "Maintain proper form for maximum effectiveness",
+            "Track your progress to stay motivated"
+        ]
+        
+        tip_box = tk.Frame(tips_frame, bg=self.theme["bg_tertiary"], padx=15, pady=15,
+                         highlightbackground=self.theme["accent"], highlightthickness=1)
+        self._register_themed(tip_box, bg="bg_tertiary", highlightbackground="accent")
+        tip_box.pack(fill='x')
+        
+        tip_text = tk.Label(tip_box, text=random.choice(tips), font=self.normal_font,
+                          bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"], wraplength=800)
+        self._register_themed(tip_text, bg="bg_tertiary", fg="text_primary")
+        tip_text.pack(anchor="w")
+    
+    def create_exercise_card(self, parent, exercise_key, col):
+        exercise = self.exercise_data[exercise_key]
+        
+        # Create card frame
+        card = tk.Frame(parent, bg=self.theme["bg_secondary"], padx=15, pady=15,
+                      highlightbackground=exercise["color"], highlightthickness=1)
+        self._register_themed(card, bg="bg_secondary")
+        card.grid(row=0, column=col, padx=10, pady=10, sticky="nsew")
+        
+        # Add exercise name
+        name_label = tk.Label(card, text=exercise["name"], font=self.subheading_font,
+                            bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
+        self._register_themed(name_label, bg="bg_secondary", fg="text_primary")
+        name_label.pack(anchor="w")
+        
+        # Add difficulty level
+        level_label = tk.Label(card, text=exercise["level"].capitalize(),
+                             font=self.small_font, bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"])
+        self._register_themed(level_label, bg="bg_secondary", fg="text_secondary")
+        level_label.pack(anchor="w", pady=(0, 10))
+        
+        # Add muscles worked
+        muscles_text = ", ".join(exercise["muscles"])
+        muscles_label = tk.Label(card, text=f"Targets: {muscles_text}",
+                               font=self.small_font, bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"],
+                               wraplength=180)
+        self._register_themed(muscles_label, bg="bg_secondary", fg="text_secondary")
+        muscles_label.pack(anchor="w", pady=(0, 10))
+        
+        # Add start button
+        start_button = tk.Button(card, text="Start", font=self.normal_font,
+                               bg=exercise["color"], fg="white", padx=10, pady=5,
+                               command=partial(self.show_exercise_view, exercise_key))
+        start_button.pack(anchor="w")
+    
+    def create_activity_item(self, parent, activity):
+        # Create activity item frame
+        item_frame = tk.Frame(parent, bg=self.theme["bg_tertiary"], padx=15, pady=15)
+        self._register_themed(item_frame, bg="bg_tertiary")
+        item_frame.pack(fill='x', padx=5, pady=5)
+        
+        # Add activity date/time
+        date_label = tk.Label(item_frame, text=activity["date"], font=self.small_font,
+                            bg=self.theme["bg_tertiary"], fg=self.theme["text_secondary"])
+        self._register_themed(date_label, bg="bg_tertiary", fg="text_secondary")
+        date_label.pack(anchor="w")
+        
+        # Add activity details
+        detail_frame = tk.Frame(item_frame, bg=self.theme["bg_tertiary"])
+        self._register_themed(detail_frame, bg="bg_tertiary")
+        detail_frame.pack(fill='x', pady=(5, 0))
+        
+        exercise_label = tk.Label(detail_frame, text=activity["exercise"],
+                                font=self.normal_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"])
+        self._register_themed(exercise_label, bg="bg_tertiary", fg="text_primary")
+        exercise_label.pack(side="left")
+        
+        duration_label = tk.Label(detail_frame, text=f"{activity['duration']} min",
+                                font=self.normal_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_secondary"])
+        self._register_themed(duration_label, bg="bg_tertiary", fg="text_secondary")
+        duration_label.pack(side="right")
+        
+        # Add performance bar if available
+        if "performance" in activity:
+            perf_frame = tk.Frame(item_frame, bg=self.theme["bg_tertiary"], pady=5)
+            self._register_themed(perf_frame, bg="bg_tertiary")
+            perf_frame.pack(fill='x')
+            
+            perf_text = tk.Label(perf_frame, text="Performance:",
+                               font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_secondary"])
+            self._register_themed(perf_text, bg="bg_tertiary", fg="text_secondary")
+            perf_text.pack(side="left")
+            
+            perf_val = tk.Label(perf_frame, text=f"{activity['performance']}%",
+                              font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"])
+            self._register_themed(perf_val, bg="bg_tertiary", fg="text_primary")
+            perf_val.pack(side="right")
+            
+            # Performance bar: a single Canvas whose fill rectangle tracks
+            # the layout width. The old nested-Frame version sized itself
+            # from winfo_reqwidth(), which is 0 before layout, so the fill
+            # never actually showed.
+            performance = min(100, max(0, activity["performance"]))
+            bar = tk.Canvas(item_frame, height=8, bg=self.theme["bg_secondary"],
+                            highlightthickness=0)
+            self._register_themed(bar, bg="bg_secondary")
+            bar.pack(fill='x', pady=(0, 5))
+            fill = bar.create_rectangle(0, 0, 0, 8, width=0,
+                                        fill=self.get_performance_color(performance))
+            bar.bind("<Configure>", lambda event, c=bar, r=fill, p=performance:
+                     c.coords(r, 0, 0, event.width * p / 100, 8))
+    
+    def get_performance_color(self, performance):
+        if performance >= 80:
+            return self.theme["success"]
+        elif performance >= 60:
+            return self.theme["warning"]
+        else:
+            return self.theme["error"]
+    
+    def clear_frame(self, frame):
+        # Destroy all widgets in the frame, hiding cached pages instead of
+        # destroying them
+        cached = set(self._pages.values())
+        for widget in frame.winfo_children():
+            if widget in cached:
+                widget.pack_forget()
+            else:
+                widget.destroy()
+    
+    def show_page(self, name, builder):
+        # Swap in a cached page frame, building it on first visit only.
+        # clear_frame hides every cached page and destroys non-cached views
+        # (the workout page packs straight into content_frame), so pages can
+        # never stack on top of a leftover view
+        self.clear_frame(self.content_frame)
+        frame = self._pages.get(name)
+        if frame is None:
+            frame = tk.Frame(self.content_frame, bg=self.theme["bg_main"])
+            self._register_themed(frame, bg="bg_main")
+            self._pages[name] = frame
+            builder(frame)
+        frame.pack(fill='both', expand=True)
+        self._current_page_frame = frame
+        self.current_page = name
+
+    def invalidate_page(self, name):
+        # Drop a cached page so the next visit rebuilds it with fresh data
+        frame = self._pages.pop(name, None)
+        if frame is not None:
+            if frame is self._current_page_frame:
+                self._current_page_frame = None
+            frame.destroy()
+        if name == "progress":
+            # The progress widgets died with the page; clear their handles so
+            # _apply_chart_theme and the tab switcher don't touch dead Tk
+            # objects (the matplotlib figure itself survives and is reused)
+            self._prog_canvas = None
+            self._sessions_tree = None
+            self._prog_stats_area = None
+            self._prog_chart_area = None
+            self._prog_sessions_area = None
+
+    def show_dashboard(self):
+        self.show_page("dashboard", self.create_dashboard)
+    
+    def show_exercise_selection(self):
+        self.show_page("exercise_selection", self.create_exercise_selection)
+
+    def create_exercise_selection(self, parent):
+        
+        # Create header
+        header_frame = tk.Frame(parent, bg=self.theme["bg_main"], padx=20, pady=20)
+        self._register_themed(header_frame, bg="bg_main")
+        header_frame.pack(fill='x')
+        
+        header_label = tk.Label(header_frame, text="Select an Exercise",
+                               font=self.heading_font, bg=self.theme["bg_main"], fg=self.theme["text_primary"])
+        self._register_themed(header_label, bg="bg_main", fg="text_primary")
+        header_label.pack(anchor="w")
+        
+        # Create grid for exercise detail cards
+        exercises_frame = tk.Frame(parent, bg=self.theme["bg_main"], padx=20, pady=10)
+        self._register_themed(exercises_frame, bg="bg_main")
+        exercises_frame.pack(fill='both', expand=True)
+        
+        row, col = 0, 0
+        for i, (exercise_key, exercise_info) in enumerate(self.exercise_data.items()):
+            if i % 2 == 0 and i > 0:
+                row += 1
+                col = 0
+                
+            self.create_exercise_detail_card(exercises_frame, exercise_key, exercise_info, row, col)
+            col += 1
+    
+    def create_exercise_detail_card(self, parent, exercise_key, exercise_info, row, col):
+        # Create card frame
+        card = tk.Frame(parent, bg=self.theme["bg_secondary"], padx=20, pady=20,
+                      highlightbackground=exercise_info["color"], highlightthickness=1)
+        self._register_themed(card, bg="bg_secondary")
+        card.grid(row=row, column=col, padx=15, pady=15, sticky="nsew")
+        
+        # Add exercise name with colored indicator
+        name_frame = tk.Frame(card, bg=self.theme["bg_secondary"])
+        self._register_themed(name_frame, bg="bg_secondary")
+        name_frame.pack(fill='x', pady=(0, 10))
+        
+        indicator = tk.Frame(name_frame, bg=exercise_info["color"], width=5, height=25)
+        indicator.pack(side="left", padx=(0, 10))
+        
+        name_label = tk.Label(name_frame, text=exercise_info["name"], font=self.subheading_font,
+                            bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
+        self._register_themed(name_label, bg="bg_secondary", fg="text_primary")
+        name_label.pack(side="left")
+        
+        # Add difficulty level
+        level_frame = tk.Frame(card, bg=self.theme["bg_secondary"])
+        self._register_themed(level_frame, bg="bg_secondary")
+        level_frame.pack(fill='x', pady=(0, 10))
+        
+        level_label = tk.Label(level_frame, text="Difficulty:",
+                             font=self.small_font, bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"])
+        self._register_themed(level_label, bg="bg_secondary", fg="text_secondary")
+        level_label.pack(side="left")
+        
+        # Add level indicator
+        level_indicator = tk.Frame(level_frame, bg=self.theme["bg_secondary"])
+        self._register_themed(level_indicator, bg="bg_secondary")
+        level_indicator.pack(side="left", padx=(5, 0))
+        
+        level = exercise_info["level"]
+        colors = {"beginner": self.theme["success"], 
+                 "intermediate": self.theme["warning"], 
+                 "advanced": self.theme["error"]}
+        levels = {"beginner": 1, "intermediate": 2, "advanced": 3}
+        
+        for i in range(3):
+            indicator = tk.Frame(level_indicator, bg=colors[level] if i < levels[level] else self.theme["bg_tertiary"],
+                               width=15, height=8)
+            indicator.pack(side="left", padx=2)
+        
+        level_text = tk.Label(level_frame, text=level.capitalize(),
+                            font=self.small_font, bg=self.theme["bg_secondary"], fg=colors[level])
+        self._register_themed(level_text, bg="bg_secondary")
+        level_text.pack(side="left", padx=(5, 0))
+        
+        # Add description
+        desc_label = tk.Label(card, text=exercise_info["description"],
+                            font=self.normal_font, bg=self.theme["bg_secondary"], fg=self.theme["text_primary"],
+                            wraplength=350, justify="left")
+        self._register_themed(desc_label, bg="bg_secondary", fg="text_primary")
+        desc_label.pack(anchor="w", pady=(0, 15))
+        
+        # Add muscles targeted
+        muscles_frame = tk.Frame(card, bg=self.theme["bg_secondary"])
+        self._register_themed(muscles_frame, bg="bg_secondary")
+        muscles_frame.pack(fill='x', pady=(0, 15))
+        
+        muscles_label = tk.Label(muscles_frame, text="Muscles:",
+                               font=self.small_font, bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"])
+        self._register_themed(muscles_label, bg="bg_secondary", fg="text_secondary")
+        muscles_label.pack(side="left")
+        
+        muscles_text = ", ".join(exercise_info["muscles"])
+        muscles_value = tk.Label(muscles_frame, text=muscles_text,
+                               font=self.small_font, bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
+        self._register_themed(muscles_value, bg="bg_secondary", fg="text_primary")
+        muscles_value.pack(side="left", padx=(5, 0))
+        
+        # Add target angle
+        angle_frame = tk.Frame(card, bg=self.theme["bg_secondary"])
+        self._register_themed(angle_frame, bg="bg_secondary")
+        angle_frame.pack(fill='x', pady=(0, 15))
+        
+        angle_label = tk.Label(angle_frame, text="Ideal Angle:",
+                             font=self.small_font, bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"])
+        self._register_themed(angle_label, bg="bg_secondary", fg="text_secondary")
+        angle_label.pack(side="left")
+        
+        angle_value = tk.Label(angle_frame, text=f"{exercise_info['target_angles']['ideal']}°",
+                             font=self.small_font, bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
+        self._register_themed(angle_value, bg="bg_secondary", fg="text_primary")
+        angle_value.pack(side="left", padx=(5, 0))
+        
+        # Add buttons
+        button_frame = tk.Frame(card, bg=self.theme["bg_secondary"])
+        self._register_themed(button_frame, bg="bg_secondary")
+        button_frame.pack(fill='x')
+        
+        start_button = tk.Button(button_frame, text="Start Exercise", font=self.normal_font,
+                               bg=exercise_info["color"], fg="white", padx=15, pady=8,
+                               command=partial(self.show_exercise_view, exercise_key))
+        start_button.pack(side="right")
+        
+        demo_button = tk.Button(button_frame, text="View Demo", font=self.normal_font,
+                              bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"], padx=15, pady=8,
+                              command=partial(self.show_demo, exercise_info["name"]))
+        self._register_themed(demo_button, bg="bg_tertiary", fg="text_primary")
+        demo_button.pack(side="right", padx=(0, 10))
+    
+    def show_demo(self, exercise_name):
+        # In a real app, this would display a video or animation
+        # For this example, just show a message
+        messagebox.showinfo("Demo", f"This would show a demonstration video for {exercise_name}.")
+    
+    def show_exercise_view(self, exercise_key):
+        self.current_page = "exercise_view"
+        self.current_exercise = exercise_key
+        self.clear_frame(self.content_frame)
+        exercise = self.exercise_data[exercise_key]
+        
+        # Create header
+        header_frame = tk.Frame(self.content_frame, bg=self.theme["bg_main"], padx=20, pady=20)
+        self._register_themed(header_frame, bg="bg_main")
+        header_frame.pack(fill='x')
+        
+        # Add back button
+        back_button = tk.Button(header_frame, text="← Back", font=self.normal_font,
+                              bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"], padx=10, pady=5,
+                              command=self.show_dashboard)
+        self._register_themed(back_button, bg="bg_tertiary", fg="text_primary")
+        back_button.pack(side="left")
+        
+        # Add exercise name
+        title_label = tk.Label(header_frame, text=exercise["name"], font=self.heading_font,
+                             bg=self.theme["bg_main"], fg=self.theme["text_primary"])
+        self._register_themed(title_label, bg="bg_main", fg="text_primary")
+        title_label.pack(side="left", padx=(20, 0))
+        
+        # Create main content with camera feed and controls
+        content_frame = tk.Frame(self.content_frame, bg=self.theme["bg_main"], padx=20)
+        self._register_themed(content_frame, bg="bg_main")
+        content_frame.pack(fill='both', expand=True)
+        
+        # Left panel for camera feed
+        left_panel = tk.Frame(content_frame, bg=self.theme["bg_secondary"])
+        self._register_themed(left_panel, bg="bg_secondary")
+        left_panel.pack(side="left", fill='both', expand=True, padx=(0, 10))
+        
+        # Camera canvas
+        camera_frame = tk.Frame(left_panel, bg="black")
+        camera_frame.pack(pady=10, padx=10)
+        
+        self.camera_canvas = tk.Canvas(camera_frame, width=self.canvas_width, height=self.canvas_height, bg="black",
+                                     highlightthickness=0)
+        self.camera_canvas.pack()
+        self._canvas_item = None
+        
+        # Placeholder for camera
+        placeholder_text = tk.Label(self.camera_canvas, text="Camera feed will appear here",
+                                  font=self.normal_font, bg="black", fg="white")
+        placeholder_text.place(relx=0.5, rely=0.5, anchor="center")
+        
+        # Camera controls
+        controls_frame = tk.Frame(left_panel, bg=self.theme["bg_secondary"], padx=10, pady=10)
+        self._register_themed(controls_frame, bg="bg_secondary")
+        controls_frame.pack(fill='x')
+        
+        # Start/Stop camera button
+        self.camera_button = tk.Button(controls_frame, text="Start Camera", font=self.normal_font,
+                                     bg=self.theme["success"], fg="white", padx=15, pady=5,
+                                     command=self.toggle_camera)
+        self._register_themed(self.camera_button, bg="success")
+        self.camera_button.pack(side="left")
+        
+        # Camera options
+        camera_options = tk.Frame(controls_frame, bg=self.theme["bg_secondary"])
+        self._register_themed(camera_options, bg="bg_secondary")
+        camera_options.pack(side="right")
+        
+        # Show skeleton checkbox
+        skeleton_check = ttk.Checkbutton(camera_options, text="Show Skeleton", variable=self.show_skeleton,
+                                       style="TCheckbutton")
+        skeleton_check.pack(side="left", padx=10)
+        
+        # Show angles checkbox
+        angles_check = ttk.Checkbutton(camera_options, text="Show Angles", variable=self.show_angles,
+                                     style="TCheckbutton")
+        angles_check.pack(side="left", padx=10)
+        
+        # Right panel for stats and feedback
+        right_panel = tk.Frame(content_frame, bg=self.theme["bg_tertiary"], width=300)
+        self._register_themed(right_panel, bg="bg_tertiary")
+        right_panel.pack(side="right", fill='both', padx=(10, 0))
+        
+        # Add exercise details
+        details_frame = tk.Frame(right_panel, bg=self.theme["bg_tertiary"], padx=15, pady=15)
+        self._register_themed(details_frame, bg="bg_tertiary")
+        details_frame.pack(fill='x')
+        
+        details_label = tk.Label(details_frame, text="Exercise Details",
+                               font=self.subheading_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"])
+        self._register_themed(details_label, bg="bg_tertiary", fg="text_primary")
+        details_label.pack(anchor="w", pady=(0, 10))
+        
+        # Muscles worked
+        muscles_frame = tk.Frame(details_frame, bg=self.theme["bg_tertiary"])
+        self._register_themed(muscles_frame, bg="bg_tertiary")
+        muscles_frame.pack(fill='x', pady=5)
+        
+        muscles_label = tk.Label(muscles_frame, text="Muscles:",
+                               font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_secondary"])
+        self._register_themed(muscles_label, bg="bg_tertiary", fg="text_secondary")
+        muscles_label.pack(side="left")
+        
+        muscles_text = ", ".join(exercise["muscles"])
+        muscles_value = tk.Label(muscles_frame, text=muscles_text,
+                               font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"])
+        self._register_themed(muscles_value, bg="bg_tertiary", fg="text_primary")
+        muscles_value.pack(side="left", padx=(5, 0))
+        
+        # Target angle
+        angle_frame = tk.Frame(details_frame, bg=self.theme["bg_tertiary"])
+        self._register_themed(angle_frame, bg="bg_tertiary")
+        angle_frame.pack(fill='x', pady=5)
+        
+        angle_label = tk.Label(angle_frame, text="Target Angle:",
+                             font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_secondary"])
+        self._register_themed(angle_label, bg="bg_tertiary", fg="text_secondary")
+        angle_label.pack(side="left")
+        
+        angle_range = f"{exercise['target_angles']['min']}° - {exercise['target_angles']['max']}°"
+        angle_value = tk.Label(angle_frame, text=angle_range,
+                             font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"])
+        self._register_themed(angle_value, bg="bg_tertiary", fg="text_primary")
+        angle_value.pack(side="left", padx=(5, 0))
+        
+        # Difficulty
+        diff_frame = tk.Frame(details_frame, bg=self.theme["bg_tertiary"])
+        self._register_themed(diff_frame, bg="bg_tertiary")
+        diff_frame.pack(fill='x', pady=5)
+        
+        diff_label = tk.Label(diff_frame, text="Difficulty:",
+                            font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_secondary"])
+        self._register_themed(diff_label, bg="bg_tertiary", fg="text_secondary")
+        diff_label.pack(side="left")
+        
+        diff_value = tk.Label(diff_frame, text=exercise["level"].capitalize(),
+                            font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"])
+        self._register_themed(diff_value, bg="bg_tertiary", fg="text_primary")
+        diff_value.pack(side="left", padx=(5, 0))
+        
+        # Add current stats
+        stats_frame = tk.Frame(right_panel, bg=self.theme["bg_tertiary"], padx=15, pady=15)
+        self._register_themed(stats_frame, bg="bg_tertiary")
+        stats_frame.pack(fill='x', pady=10)
+        
+        stats_label = tk.Label(stats_frame, text="Current Session",
+                             font=self.subheading_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"])
+        self._register_themed(stats_label, bg="bg_tertiary", fg="text_primary")
+        stats_label.pack(anchor="w", pady=(0, 10))
+        
+        # Time counter
+        time_frame = tk.Frame(stats_frame, bg=self.theme["bg_tertiary"])
+        self._register_themed(time_frame, bg="bg_tertiary")
+        time_frame.pack(fill='x', pady=5)
+        
+        time_label = tk.Label(time_frame, text="Duration:",
+                            font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_secondary"])
+        self._register_themed(time_label, bg="bg_tertiary", fg="text_secondary")
+        time_label.pack(side="left")
+        
+        self.time_value = tk.Label(time_frame, text="00:00",
+                                 font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"])
+        self._register_themed(self.time_value, bg="bg_tertiary", fg="text_primary")
+        self.time_value.pack(side="left", padx=(5, 0))
+        
+        # Rep counter
+        rep_frame = tk.Frame(stats_frame, bg=self.theme["bg_tertiary"])
+        self._register_themed(rep_frame, bg="bg_tertiary")
+        rep_frame.pack(fill='x', pady=5)
+        
+        rep_label = tk.Label(rep_frame, text="Repetitions:",
+                           font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_secondary"])
+        self._register_themed(rep_label, bg="bg_tertiary", fg="text_secondary")
+        rep_label.pack(side="left")
+        
+        self.rep_value = tk.Label(rep_frame, text="0",
+                                font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"])
+        self._register_themed(self.rep_value, bg="bg_tertiary", fg="text_primary")
+        self.rep_value.pack(side="left", padx=(5, 0))
+        
+        # Current angle
+        curr_angle_frame = tk.Frame(stats_frame, bg=self.theme["bg_tertiary"])
+        self._register_themed(curr_angle_frame, bg="bg_tertiary")
+        curr_angle_frame.pack(fill='x', pady=5)
+        
+        curr_angle_label = tk.Label(curr_angle_frame, text="Current Angle:",
+                                  font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_secondary"])
+        self._register_themed(curr_angle_label, bg="bg_tertiary", fg="text_secondary")
+        curr_angle_label.pack(side="left")
+        
+        self.curr_angle_value = tk.Label(curr_angle_frame, text="0°",
+                                       font=self.small_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"])
+        self._register_themed(self.curr_angle_value, bg="bg_tertiary", fg="text_primary")
+        self.curr_angle_value.pack(side="left", padx=(5, 0))
+        
+        # Add feedback section
+        feedback_frame = tk.Frame(right_panel, bg=self.theme["bg_tertiary"], padx=15, pady=15)
+        self._register_themed(feedback_frame, bg="bg_tertiary")
+        feedback_frame.pack(fill='x', pady=10)
+        
+        feedback_label = tk.Label(feedback_frame, text="Feedback",
+                                font=self.subheading_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"])
+        self._register_themed(feedback_label, bg="bg_tertiary", fg="text_primary")
+        feedback_label.pack(anchor="w", pady=(0, 10))
+        
+        self.feedback_box = tk.Label(feedback_frame, text="Start camera to begin receiving feedback",
+                                   font=self.normal_font, bg=self.theme["bg_main"], fg=self.theme["text_primary"],
+                                   wraplength=250, justify="center", padx=20, pady=20, height=5)
+        self._register_themed(self.feedback_box, bg="bg_main", fg="text_primary")
+        self.feedback_box.pack(fill='x')
+        
+        # Add voice feedback option
+        voice_frame = tk.Frame(right_panel, bg=self.theme["bg_tertiary"], padx=15, pady=15)
+        self._register_themed(voice_frame, bg="bg_tertiary")
+        voice_frame.pack(fill='x')
+        
+        voice_check = ttk.Checkbutton(voice_frame, text="Voice Feedback", variable=self.use_voice_feedback,
+                                     style="TCheckbutton")
+        voice_check.pack(side="left")
+        
+        # Add end session button
+        end_button = tk.Button(right_panel, text="End Session", font=self.normal_font,
+                             bg=self.theme["error"], fg="white", padx=15, pady=10,
+                             command=self.end_exercise_session)
+        self._register_themed(end_button, bg="error")
+        end_button.pack(pady=20)
+    
+    @contextlib.contextmanager
+    def _camera(self, camera_id):
+        # Short-lived capture handle (probing, testing) that always gets
+        # released; opens via the same fast platform backend as sessions
+        cap = self.open_camera(camera_id)
+        try:
+            yield cap
+        finally:
+            cap.release()
+
+    def open_camera(self, camera_id):
+        # Open the camera with the platform backend and low-latency settings:
+        # a single-frame buffer avoids stale frames and MJPG cuts USB bandwidth
+        system = platform.system()
+        if system == "Windows":
+            backend = cv2.CAP_DSHOW
+        elif system == "Darwin":
+            backend = cv2.CAP_AVFOUNDATION
+        elif system == "Linux":
+            backend = cv2.CAP_V4L2
+        else:
+            backend = cv2.CAP_ANY
+        cap = cv2.VideoCapture(camera_id, backend)
+        if not cap.isOpened():
+            return cap
+        settings = [
+            (cv2.CAP_PROP_BUFFERSIZE, 1),
+            (cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG')),
+            (cv2.CAP_PROP_FRAME_WIDTH, 640),
+            (cv2.CAP_PROP_FRAME_HEIGHT, 480),
+            (cv2.CAP_PROP_FPS, 30),
+        ]
+        for prop, value in settings:
+            if not cap.set(prop, value):
+                print(f"Camera driver ignored property {prop}={value}")
+        return cap
+
+    def push_angle(self, angle):
+        # O(1) moving average: subtract the evicted sample, add the new one.
+        # The buffer starts zeroed, so evicted slots are 0 until it fills.
+        self._ang_sum += angle - self._ang_buf[self._ang_idx]
+        self._ang_buf[self._ang_idx] = angle
+        self._ang_idx = (self._ang_idx + 1) % len(self._ang_buf)
+        if self._ang_count < len(self._ang_buf):
+            self._ang_count += 1
+        return self._ang_sum / self._ang_count
+
+    def reset_angle_buffer(self):
+        self._ang_buf.fill(0.0)
+        self._ang_idx = 0
+        self._ang_sum = 0.0
+        self._ang_count = 0
+
+    def toggle_camera(self):
+        if self.camera_active:
+            self.stop_camera()
+        else:
+            self.start_camera()
+    
+    def start_camera(self):
+        if self.cap is not None:
+            return
+
+        if not self.models_ready:
+            messagebox.showinfo("Loading", "Models are still loading, please wait a moment...")
+            return
+            
+        self.session_start_time = time.time()
+        self.session_reps = 0
+        self.reset_angle_buffer()
+        self._rep_fsm[self.current_exercise].reset()
+        self._prev_gray = None
+        self._last_pose_results = None
+        self._person_present = True
+        self._sa_n = 0
+        self.session_feedback = []
+        
+        # Start camera
+        try:
+            self.cap = self.open_camera(self.camera_id)
+            if not self.cap.isOpened():
+                messagebox.showerror("Error", "Could not open camera. Please check your camera settings.")
+                self.cap = None
+                return
+                
+            self.camera_active = True
+            self.camera_button.config(text="Stop Camera", bg=self.theme["error"])
+            self._register_themed(self.camera_button, bg="error")
+
+            # Start capture thread (reads frames at native rate, keeps newest)
+            self._cap_stop.clear()
+            with self._frame_lock:
+                self._slot_fresh = False
+            self.capture_thread = threading.Thread(target=self.capture_loop)
+            self.capture_thread.daemon = True
+            self.capture_thread.start()
+
+            # Start processing thread
+            self.camera_thread = threading.Thread(target=self.process_camera_feed)
+            self.camera_thread.daemon = True
+            self.camera_thread.start()
+
+            # Drive canvas repaints from the Tk event loop at display rate
+            self._display_new = False
+            with self._ui_lock:
+                self._pending_ui.clear()
+            self._ui_last.clear()
+            self.root.after(33, self.render_tick)
+            self.root.after(33, self._flush_ui)
+            
+            # Start timer update on the Tk event loop
+            self.root.after(1000, self._update_time)
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Error starting camera: {str(e)}")
+    
+    def stop_camera(self):
+        self.camera_active = False
+        self._cap_stop.set()
+        # Let both workers drain before the capture handle goes away, so no
+        # stale frame or UI update can land after shutdown
+        for t in (getattr(self, "capture_thread", None),
+                  getattr(self, "camera_thread", None)):
+            if t is not None and t.is_alive():
+                t.join(timeout=1.0)
+        if self.cap:
+            self.cap.release()
+            self.cap = None
+        with self._ui_lock:
+            self._pending_ui.clear()
+        self.camera_button.config(text="Start Camera", bg=self.theme["success"])
+        self._register_themed(self.camera_button, bg="success")
+
+    def _safe_after(self, fn, *args):
+        # Schedule UI work only while the window is alive; stops leaked
+        # worker callbacks from firing into a destroyed interpreter
+        try:
+            if self.root.winfo_exists():
+                self.root.after_idle(fn, *args)
+        except tk.TclError:
+            pass
+    
+    def capture_loop(self):
+        # Capture and pre-process at the camera's native rate: read, resize
+        # for display, build the small RGB pose input, then swap the filled
+        # buffer set into the slot so the processing thread spends its time
+        # on the models rather than pixel shuffling
+        while not self._cap_stop.is_set() and self.cap and self.cap.isOpened():
+            ret, frame = self.cap.read()
+            if not ret:
+                break
+            display_frame, image_rgb = self.prepare_frames(frame, self._buf_write)
+            self._buf_write[0] = frame
+            self._buf_write[1] = display_frame
+            self._buf_write[2] = image_rgb
+            with self._frame_lock:
+                self._buf_write, self._buf_slot = self._buf_slot, self._buf_write
+                self._slot_fresh = True
+
+    def prepare_frames(self, frame, bufset):
+        # Resize the capture for display and downscale/convert the pose model
+        # input, writing into the given buffer set. With OpenCL available the
+        # chain runs on the iGPU via the T-API and only downloads at the end;
+        # otherwise it stays on the preallocated CPU buffers. Landmarks come
+        # back normalized, so drawing needs no coordinate rescaling.
+        if self.use_opencl:
+            umat = cv2.UMat(frame)
+            display_u = cv2.resize(umat, (self.canvas_width, self.canvas_height))
+            small_u = cv2.resize(display_u, (self.infer_width, self.infer_height),
+                                 interpolation=cv2.INTER_AREA)
+            rgb_u = cv2.cvtColor(small_u, cv2.COLOR_BGR2RGB)
+            return display_u.get(), rgb_u.get()
+        if frame.shape[1] == self.canvas_width and frame.shape[0] == self.canvas_height:
+            # The driver honoured the requested 640x480, so the capture is
+            # already display-sized and the resize pass disappears entirely
+            display_frame = frame
+        else:
+            display_frame = cv2.resize(frame, (self.canvas_width, self.canvas_height),
+                                       dst=bufset[1])
+        small_frame = cv2.resize(display_frame, (self.infer_width, self.infer_height),
+                                 dst=self._infer_buf, interpolation=cv2.INTER_AREA)
+        image_rgb = cv2.cvtColor(small_frame, cv2.COLOR_BGR2RGB, dst=bufset[2])
+        return display_frame, image_rgb
+
+    def process_camera_feed(self):
+        while self.camera_active:
+            with self._frame_lock:
+                fresh = self._slot_fresh
+                if fresh:
+                    self._buf_read, self._buf_slot = self._buf_slot, self._buf_read
+                    self._slot_fresh = False
+            if not fresh:
+                time.sleep(0.005)
+                continue
+            frame, display_frame, image_rgb = self._buf_read
+            t_start = time.perf_counter()
+
+            if self._pose_swap_pending:
+                # Accuracy toggle arrived mid-session: this thread owns
+                # pose.process(), so it swaps estimators between frames
+                self._pose_swap_pending = False
+                old_pose = self.pose
+                self.pose = self.create_pose_estimator()
+                try:
+                    old_pose.close()
+                except Exception:
+                    pass
+                self._last_pose_results = None
+
+            # Detection and pose estimation are independent on the same
+            # frame, and both release the GIL inside their native cores, so
+            # run them in parallel; detection still honours the N-frame skip
+            run_detect = (self.model is not None
+                          and self._frame_counter % self.yolo_every == 0)
+            detect_future = self._infer_pool.submit(self.infer, frame) if run_detect else None
+            self._frame_counter += 1
+
+            if not self._person_present:
+                # The detector's last verdict saw nobody: skip the pose
+                # model entirely and tell the user, instead of chasing
+                # landmarks through an empty frame
+                pose_results = None
+                self.queue_ui(feedback=("No person detected",
+                                        self._fb_color["No person detected"]))
+            else:
+                # Cheap change gate: compare 32x32 grayscale thumbnails and
+                # skip the pose DNN while the scene is effectively static
+                # (rest periods), but never coast for more than half a second
+                gray = cv2.cvtColor(cv2.resize(image_rgb, (32, 32)),
+                                    cv2.COLOR_RGB2GRAY).astype(np.int16)
+                run_pose = (self._last_pose_results is None
+                            or self._prev_gray is None
+                            or np.abs(gray - self._prev_gray).mean() >= 2.0
+                            or t_start - self._last_pose_t >= 0.5)
+                if run_pose:
+                    self._prev_gray = gray
+                    self._last_pose_t = t_start
+                    pose_results = self.pose.process(image_rgb)
+                    self._last_pose_results = pose_results
+                else:
+                    pose_results = self._last_pose_results
+            if detect_future is not None:
+                try:
+                    self._last_detections = detect_future.result()
+                except Exception:
+                    self._last_detections = None
+                self._person_present = self.detections_contain_person(self._last_detections)
+            
+            # The read buffer set belongs to this thread until the next
+            # slot swap, so overlays draw straight onto the display frame
+            output_frame = display_frame
+            
+            if pose_results is not None and pose_results.pose_landmarks:
+                # Gather all 33 landmarks into one float32 array and scale
+                # to pixel coordinates in a single vector op instead of
+                # building 33 Python tuples per frame
+                pts = np.fromiter(
+                    (v for lm in pose_results.pose_landmarks.landmark
+                     for v in (lm.x, lm.y)),
+                    dtype=np.float32, count=66).reshape(33, 2)
+                pts *= self._lm_scale
+                pts = pts.astype(np.int32)
+
+                # Draw skeleton if enabled
+                if self._show_skeleton:
+                    self.draw_skeleton(output_frame, pts)
+
+
+                # Look up the current exercise's keypoints and target angles
+                # from the SoA arrays (padded with -1 sentinels)
+                ex_idx = self._ex_ids[self.current_exercise]
+                keypoints = self._kp[ex_idx]
+                t_min = self._target_min[ex_idx]
+                t_max = self._target_max[ex_idx]
+
+                # Calculate angle
+                if keypoints[2] >= 0:
+                    a = pts[keypoints[0]]
+                    b = pts[keypoints[1]]
+                    c = pts[keypoints[2]]
+
+                    angle = compute_angle(a[0], a[1], b[0], b[1], c[0], c[1])
+                    avg_angle = self.push_angle(angle)
+                    
+                    # Store for analysis
+                    if self._sa_n < self.session_angles.shape[0]:
+                        self.session_angles[self._sa_n] = avg_angle
+                        self._sa_n += 1
+                    
+                    # Draw angle if enabled
+                    if self._show_angles:
+                        # Draw angle lines
+                        pa, pb, pc = (int(a[0]), int(a[1])), (int(b[0]), int(b[1])), (int(c[0]), int(c[1]))
+                        cv2.line(output_frame, pb, pa, (0, 255, 0), 2)
+                        cv2.line(output_frame, pb, pc, (0, 255, 0), 2)
+                        
+                        # Draw angle value
+                        angle_text = f"{int(avg_angle)}°"
+                        cv2.putText(output_frame, angle_text, 
+                                   (pb[0] - 50, pb[1] + 50), 
+                                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+                    
+                    # Update angle display
+                    self.queue_ui(angle=int(avg_angle))
+                    
+                    # Count reps via the per-exercise state machine
+                    if self._rep_fsm[self.current_exercise].step(avg_angle):
+                        self.session_reps += 1
+                        self.queue_ui(reps=self.session_reps)
+
+                    # Generate feedback
+                    feedback = self.generate_feedback(avg_angle, t_min, t_max, self.current_exercise)
+                    self.session_feedback.append(feedback)
+                    
+                    # Show feedback
+                    feedback_color = self._fb_color.get(feedback, self.theme["error"])
+                    self.queue_ui(feedback=(feedback, feedback_color))
+                
+            # Publish the frame for the display tick; the canvas itself is
+            # only touched from the Tk main thread in render_tick
+            self.processed_frame = cv2.cvtColor(output_frame, cv2.COLOR_BGR2RGBA, dst=self._rgba_buf)
+            with self._display_lock:
+                np.copyto(self._display_buf, self.processed_frame)
+                self._display_new = True
+
+            # Adaptive pacing: sleep only the remainder of the frame
+            # budget, predicted from recent per-frame cost, instead of a
+            # fixed 30 ms that oversleeps fast frames and starves slow ones
+            self._delay_hist.append(time.perf_counter() - t_start)
+            predicted = sum(self._delay_hist) / len(self._delay_hist)
+            time.sleep(max(0.0, 1.0 / self.target_fps - predicted))
+
+    def draw_skeleton(self, frame, pts):
+        # Draw every bone in one batched polylines call by indexing the
+        # precomputed connection pairs into the landmark array, then dot the
+        # joints; far cheaper than mp_drawing's per-connection Python loop
+        segments = pts[self._connections]
+        cv2.polylines(frame, segments, isClosed=False, color=(0, 255, 0), thickness=2)
+        for px, py in pts:
+            cv2.circle(frame, (px, py), 2, (0, 255, 0), -1)
+
+    def queue_ui(self, **fields):
+        # Worker threads stage label values here; _flush_ui drains them on
+        # the Tk main thread at display rate
+        with self._ui_lock:
+            self._pending_ui.update(fields)
+
+    def _flush_ui(self):
+        # One coalesced batch of widget writes per display frame, skipping
+        # values that have not changed since the last batch
+        if not self.camera_active:
+            return
+        with self._ui_lock:
+            pending, self._pending_ui = self._pending_ui, {}
+        for key, value in pending.items():
+            if self._ui_last.get(key) == value:
+                continue
+            self._ui_last[key] = value
+            if key == "angle":
+                self.curr_angle_value.config(text=f"{value}°")
+            elif key == "reps":
+                self.rep_value.config(text=str(value))
+            elif key == "feedback":
+                text, color = value
+                self.feedback_box.config(text=text, bg=color, fg="white")
+        self.root.after(33, self._flush_ui)
+
+    def render_tick(self):
+        # Paint the newest processed frame at display rate (~30 Hz),
+        # decoupled from however fast inference happens to run
+        if not self.camera_active:
+            return
+        with self._display_lock:
+            if self._display_new:
+                if self._tk_img is None:
+                    self._tk_img = ImageTk.PhotoImage(self._pil_img)
+                else:
+                    self._tk_img.paste(self._pil_img)
+                if self._canvas_item is None:
+                    # One canvas item for the lifetime of the canvas; later
+                    # frames just repaint the PhotoImage pixels in place
+                    self._canvas_item = self.camera_canvas.create_image(
+                        0, 0, anchor="nw", image=self._tk_img)
+                self._display_new = False
+        self.root.after(33, self.render_tick)
+    
+    def setup_onnx_session(self):
+        # Export the model to ONNX once (cached under the app dir) and load it
+        # with onnxruntime so CPU inference skips the PyTorch Python graph
+        try:
+            import onnxruntime as ort
+        except ImportError:
+            return
+        try:
+            onnx_path = os.path.join(self.app_dir, "best.onnx")
+            if not os.path.exists(onnx_path):
+                exported = self.model.export(format='onnx', imgsz=480, half=False,
+                                             simplify=True, dynamic=False)
+                if exported and os.path.exists(exported):
+                    os.replace(exported, onnx_path)
+            options = ort.SessionOptions()
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            options.intra_op_num_threads = os.cpu_count() or 1
+            available = ort.get_available_providers()
+            providers = [p for p in ("OpenVINOExecutionProvider", "CPUExecutionProvider")
+                         if p in available]
+            self.ort_session = ort.InferenceSession(onnx_path, sess_options=options,
+                                                    providers=providers)
+            self.ort_input_name = self.ort_session.get_inputs()[0].name
+            # Preallocated NCHW input so letterboxing never reallocates
+            self.onnx_input = np.full((1, 3, 480, 480), 114 / 255.0, dtype=np.float32)
+        except Exception as e:
+            self.ort_session = None
+            print(f"ONNX session unavailable, using PyTorch model: {e}")
+
+    def setup_int8_model(self):
+        # Export the detector to INT8 OpenVINO IR once (cached in the app
+        # dir) and reload it through the same YOLO predict API. INT8 halves
+        # memory traffic and doubles ALU throughput on VNNI-capable CPUs;
+        # any failure leaves the FP32 model in place.
+        try:
+            ir_dir = os.path.join(self.app_dir, "best_int8_openvino_model")
+            if not os.path.isdir(ir_dir):
+                exported = self.model.export(format='openvino', int8=True, imgsz=480)
+                if exported and os.path.isdir(str(exported)) and str(exported) != ir_dir:
+                    os.replace(str(exported), ir_dir)
+            self.model = YOLO(ir_dir)
+            self.int8_active = True
+            # The quantized model supersedes the FP32 ONNX session
+            self.ort_session = None
+        except Exception as e:
+            self.int8_active = False
+            print(f"INT8 model unavailable, keeping FP32 weights: {e}")
+
+    def toggle_int8_mode(self):
+        # Reload the detector in the background with the chosen precision
+        if not self.models_ready:
+            return
+        threading.Thread(target=self.apply_precision_choice, daemon=True).start()
+
+    def apply_precision_choice(self):
+        if self.use_int8.get():
+            self.setup_int8_model()
+            return
+        try:
+            model_path = os.path.join(self.app_dir, "best.pt")
+            weights = model_path if os.path.exists(model_path) else "best.pt"
+            self.model = YOLO(weights).to(self.device)
+            self.int8_active = False
+            if self.device == 'cpu':
+                self.setup_onnx_session()
+        except Exception as e:
+            print(f"Error reloading FP32 model: {e}")
+
+    def infer(self, frame):
+        # Run detection on one BGR frame, preferring the ONNX session on CPU
+        if self.ort_session is None:
+            return self.model.predict(frame, device=self.device, half=self.use_half,
+                                      imgsz=480, verbose=False)
+        h, w = frame.shape[:2]
+        scale = 480.0 / max(h, w)
+        nw, nh = int(w * scale), int(h * scale)
+        resized = cv2.resize(frame, (nw, nh))
+        rgb = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
+        self.onnx_input[:] = 114 / 255.0
+        self.onnx_input[0, :, :nh, :nw] = rgb.transpose(2, 0, 1).astype(np.float32) / 255.0
+        return self.ort_session.run(None, {self.ort_input_name: self.onnx_input})[0]
+
+    def detections_contain_person(self, detections):
+        # Person-presence verdict from either detector output format: a raw
+        # YOLOv8 ONNX tensor (1, 84, N) with the person score in row 4, or
+        # an ultralytics Results list with class/confidence tensors
+        if detections is None:
+            return True
+        try:
+            if isinstance(detections, np.ndarray):
+                return float(detections[0, 4].max()) > 0.5
+            boxes = detections[0].boxes
+            return bool(((boxes.cls == 0) & (boxes.conf > 0.5)).any())
+        except Exception:
+            # Unknown format: never block the pose path on a parse failure
+            return True
+
+    def generate_feedback(self, angle, t_min, t_max, exercise_type):
+        feedback = "No feedback available"
+        
+        if exercise_type == "bicep curl":
+            if angle > t_max - 10:
+                feedback = "Extend more"
+            elif angle < t_min + 10:
+                feedback = "Curl Complete"
+            else:
+                feedback = "Good Form"
+                
+        elif exercise_type == "push-up":
+            if angle > t_max - 10:
+                feedback = "Keep body straight"
+            elif angle < t_min + 10:
+                feedback = "Good Form"
+            else:
+                feedback = "Adjust your posture"
+                
+        elif exercise_type == "squat":
+            if angle < t_min + 10:
+                feedback = "Too Low"
+            elif angle > t_max - 10:
+                feedback = "Stand Up Straight"
+            else:
+                feedback = "Good Squat"
+                
+        elif exercise_type == "shoulder press":
+            if angle > t_max - 10:
+                feedback = "Locked Out"
+            elif angle < t_min + 10:
+                feedback = "Push Higher"
+            else:
+                feedback = "Good Form"
+                
+        return feedback
+    
+    def _update_time(self):
+        # Session clock driven by Tk's own scheduler; no timer thread and
+        # no cross-thread widget writes
+        if not self.camera_active:
+            return
+        if self.session_start_time:
+            elapsed = int(time.time() - self.session_start_time)
+            self.time_value.config(text=f"{elapsed // 60:02d}:{elapsed % 60:02d}")
+        self.root.after(1000, self._update_time)
+    
+    def end_exercise_session(self):
+        if self.camera_active:
+            self.stop_camera()
+            
+            # Calculate session stats
+            if self.session_start_time:
+                duration = int(time.time() - self.session_start_time)
+                
+                # Save session
+                self.save_session(duration)
+                
+                # Show summary
+                self.show_session_summary(duration)
+    
+    def save_session(self, duration):
+        if not self._sa_n:
+            return
+            
+        # Calculate performance score based on how well angles match target
+        exercise = self.exercise_data[self.current_exercise]
+        target = exercise["target_angles"]["ideal"]
+        max_deviation = max(target - exercise["target_angles"]["min"], 
+                          exercise["target_angles"]["max"] - target)
+        
+        angles = self.session_angles[:self._sa_n]
+        performance = int(perf_score(angles, float(target), float(max_deviation)) * 100)
+        
+        # Create session record
+        session = {
+            "date": datetime.datetime.now().strftime("%Y-%m-%d %H:%M"),
+            "exercise": exercise["name"],
+            "duration": duration // 60,  # Convert to minutes
+            "reps": self.session_reps,
+            "performance": performance,
+            "angles": angles[:100].tolist()  # Limit to 100 records
+        }
+        
+        # Append-only session log: one JSON line per session, so saving
+        # never re-reads or rewrites the existing history
+        self.append_activity(session)
+
+        # The dashboard's recent-activity list is now stale
+        self.invalidate_page("dashboard")
+        self.invalidate_page("progress")
+    
+    def show_session_summary(self, duration):
+        # Create popup window
+        summary = tk.Toplevel(self.root)
+        summary.title("Session Summary")
+        summary.geometry("600x500")
+        summary.configure(bg=self.theme["bg_main"])
+        summary.transient(self.root)
+        summary.grab_set()
+        
+        # Add header
+        header_frame = tk.Frame(summary, bg=self.theme["bg_main"], padx=20, pady=20)
+        self._register_themed(header_frame, bg="bg_main")
+        header_frame.pack(fill='x')
+        
+        header_label = tk.Label(header_frame, text="Session Complete!", font=self.heading_font,
+                              bg=self.theme["bg_main"], fg=self.theme["text_primary"])
+        self._register_themed(header_label, bg="bg_main", fg="text_primary")
+        header_label.pack(anchor="w")
+        
+        exercise = self.exercise_data[self.current_exercise]["name"]
+        subheader_label = tk.Label(header_frame, text=f"Exercise: {exercise}", font=self.subheading_font,
+                                 bg=self.theme["bg_main"], fg=self.theme["text_primary"])
+        self._register_themed(subheader_label, bg="bg_main", fg="text_primary")
+        subheader_label.pack(anchor="w")
+        
+        # Add stats
+        stats_frame = tk.Frame(summary, bg=self.theme["bg_main"], padx=20, pady=10)
+        self._register_themed(stats_frame, bg="bg_main")
+        stats_frame.pack(fill='x')
+        
+        stats_label = tk.Label(stats_frame, text="Session Statistics", font=self.subheading_font,
+                             bg=self.theme["bg_main"], fg=self.theme["text_primary"])
+        self._register_themed(stats_label, bg="bg_main", fg="text_primary")
+        stats_label.pack(anchor="w", pady=(0, 10))
+        
+        # Create 2x2 grid for stats
+        grid_frame = tk.Frame(stats_frame, bg=self.theme["bg_main"])
+        self._register_themed(grid_frame, bg="bg_main")
+        grid_frame.pack(fill='x')
+        
+        # Duration
+        duration_frame = tk.Frame(grid_frame, bg=self.theme["bg_secondary"], padx=15, pady=15)
+        self._register_themed(duration_frame, bg="bg_secondary")
+        duration_frame.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
+        
+        duration_label = tk.Label(duration_frame, text="Duration", font=self.normal_font,
+                                bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"])
+        self._register_themed(duration_label, bg="bg_secondary", fg="text_secondary")
+        duration_label.pack(anchor="w")
+        
+        minutes = duration // 60
+        seconds = duration % 60
+        time_string = f"{minutes}m {seconds}s"
+        duration_value = tk.Label(duration_frame, text=time_string, font=self.subheading_font,
+                                bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
+        self._register_themed(duration_value, bg="bg_secondary", fg="text_primary")
+        duration_value.pack(anchor="w")
+        
+        # Repetitions
+        reps_frame = tk.Frame(grid_frame, bg=self.theme["bg_secondary"], padx=15, pady=15)
+        self._register_themed(reps_frame, bg="bg_secondary")
+        reps_frame.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
+        
+        reps_label = tk.Label(reps_frame, text="Repetitions", font=self.normal_font,
+                            bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"])
+        self._register_themed(reps_label, bg="bg_secondary", fg="text_secondary")
+        reps_label.pack(anchor="w")
+        
+        reps_value = tk.Label(reps_frame, text=str(self.session_reps), font=self.subheading_font,
+                            bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
+        self._register_themed(reps_value, bg="bg_secondary", fg="text_primary")
+        reps_value.pack(anchor="w")
+        
+        # Performance
+        if self._sa_n:
+            exercise = self.exercise_data[self.current_exercise]
+            target = exercise["target_angles"]["ideal"]
+            max_deviation = max(target - exercise["target_angles"]["min"], 
+                              exercise["target_angles"]["max"] - target)
+            
+            angles = self.session_angles[:self._sa_n]
+            performance = int(perf_score(angles, float(target), float(max_deviation)) * 100)
+            
+            perf_frame = tk.Frame(grid_frame, bg=self.theme["bg_secondary"], padx=15, pady=15)
+            self._register_themed(perf_frame, bg="bg_secondary")
+            perf_frame.grid(row=1, column=0, padx=10, pady=10, sticky="nsew")
+            
+            perf_label = tk.Label(perf_frame, text="Performance", font=self.normal_font,
+                                bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"])
+            self._register_themed(perf_label, bg="bg_secondary", fg="text_secondary")
+            perf_label.pack(anchor="w")
+            
+            perf_value = tk.Label(perf_frame, text=f"{performance}%", font=self.subheading_font,
+                                bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
+            self._register_themed(perf_value, bg="bg_secondary", fg="text_primary")
+            perf_value.pack(anchor="w")
+            
+            # Common feedback
+            most_common = Counter(self.session_feedback).most_common(1)[0]
+            
+            feedback_frame = tk.Frame(grid_frame, bg=self.theme["bg_secondary"], padx=15, pady=15)
+            self._register_themed(feedback_frame, bg="bg_secondary")
+            feedback_frame.grid(row=1, column=1, padx=10, pady=10, sticky="nsew")
+            
+            feedback_label = tk.Label(feedback_frame, text="Most Common Feedback", font=self.normal_font,
+                                    bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"])
+            self._register_themed(feedback_label, bg="bg_secondary", fg="text_secondary")
+            feedback_label.pack(anchor="w")
+            
+            feedback_value = tk.Label(feedback_frame, text=most_common[0], font=self.subheading_font,
+                                    bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
+            self._register_themed(feedback_value, bg="bg_secondary", fg="text_primary")
+            feedback_value.pack(anchor="w")
+            
+            # Add angle chart
+            chart_frame = tk.Frame(summary, bg=self.theme["bg_main"], padx=20, pady=10)
+            self._register_themed(chart_frame, bg="bg_main")
+            chart_frame.pack(fill='both', expand=True)
+            
+            chart_label = tk.Label(chart_frame, text="Angle Progression", font=self.subheading_font,
+                                 bg=self.theme["bg_main"], fg=self.theme["text_primary"])
+            self._register_themed(chart_label, bg="bg_main", fg="text_primary")
+            chart_label.pack(anchor="w", pady=(0, 10))
+            
+            # Build the figure once and keep it; later summaries clear the
+            # axes and replot instead of paying figure + layout setup again
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            if self._summary_fig is None:
+                import matplotlib
+                matplotlib.rcParams["path.simplify"] = True
+                matplotlib.rcParams["path.simplify_threshold"] = 1.0
+                from matplotlib.figure import Figure
+                self._summary_fig = Figure(figsize=(5, 3), dpi=100)
+                self._summary_ax = self._summary_fig.add_subplot(111)
+            ax = self._summary_ax
+            ax.clear()
+            
+            # Bin the full angle stream down to ~100 points: plot the
+            # per-bin mean with a min/max envelope rather than handing
+            # matplotlib thousands of raw samples to rasterize
+            step = max(1, self._sa_n // 100)
+            trimmed = angles[:step * (self._sa_n // step)].reshape(-1, step)
+            means = trimmed.mean(axis=1)
+            ax.plot(means, color=exercise["color"])
+            if step > 1:
+                ax.fill_between(np.arange(len(means)), trimmed.min(axis=1),
+                                trimmed.max(axis=1), color=exercise["color"],
+                                alpha=0.2)
+            
+            # Add target range
+            ax.axhline(y=exercise["target_angles"]["ideal"], color='green', linestyle='--', alpha=0.7)
+            ax.axhspan(exercise["target_angles"]["min"], exercise["target_angles"]["max"], 
+                     alpha=0.2, color='green')
+            
+            ax.set_ylabel('Angle (degrees)')
+            ax.set_xlabel('Time')
+            ax.grid(True, alpha=0.3)
+            
+            # Add chart to frame (a fresh Tk canvas per popup, but the
+            # same cached figure behind it)
+            canvas = FigureCanvasTkAgg(self._summary_fig, master=chart_frame)
+            canvas.draw()
+            canvas.get_tk_widget().pack(fill='both', expand=True)
+        
+        # Add buttons
+        button_frame = tk.Frame(summary, bg=self.theme["bg_main"], padx=20, pady=20)
+        self._register_themed(button_frame, bg="bg_main")
+        button_frame.pack(fill='x')
+        
+        close_button = tk.Button(button_frame, text="Close", font=self.normal_font,
+                               bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"], padx=15, pady=8,
+                               command=summary.destroy)
+        self._register_themed(close_button, bg="bg_tertiary", fg="text_primary")
+        close_button.pack(side="right")
+        
+        new_session_button = tk.Button(button_frame, text="New Session", font=self.normal_font,
+                                     bg=self.theme["success"], fg="white", padx=15, pady=8,
+                                     command=lambda: [summary.destroy(), self.show_exercise_selection()])
+        self._register_themed(new_session_button, bg="success")
+        new_session_button.pack(side="right", padx=10)
+    
+    def show_progress(self):
+        self.show_page("progress", self.create_progress)
+
+    def create_progress(self, parent):
+        
+        # Create header
+        header_frame = tk.Frame(parent, bg=self.theme["bg_main"], padx=20, pady=20)
+        self._register_themed(header_frame, bg="bg_main")
+        header_frame.pack(fill='x')
+        
+        header_label = tk.Label(header_frame, text="Progress Tracker", font=self.heading_font,
+                              bg=self.theme["bg_main"], fg=self.theme["text_primary"])
+        self._register_themed(header_label, bg="bg_main", fg="text_primary")
+        header_label.pack(anchor="w")
+        
+        # Create charts frame
+        charts_frame = tk.Frame(parent, bg=self.theme["bg_main"], padx=20, pady=10)
+        self._register_themed(charts_frame, bg="bg_main")
+        charts_frame.pack(fill='both', expand=True)
+        
+        # Load activities
+        activities = self.load_recent_activities()
+        
+        if not activities:
+            no_data = tk.Label(charts_frame, text="No activity data available yet. Complete exercise sessions to see your progress.",
+                             font=self.normal_font, bg=self.theme["bg_tertiary"], fg=self.theme["text_secondary"],
+                             padx=15, pady=30)
+            self._register_themed(no_data, bg="bg_tertiary", fg="text_secondary")
+            no_data.pack(fill='x', padx=5, pady=5)
+            return
+            
+        # Group once by exercise; tab switches index the dict instead of
+        # rescanning the whole activity list
+        self._by_exercise = {}
+        for a in activities:
+            self._by_exercise.setdefault(a["exercise"], []).append(a)
+
+        # Numeric columns per exercise so the stats cards and chart reduce
+        # arrays instead of re-walking dicts on every tab switch
+        self._ex_stats = {}
+        for name, acts in self._by_exercise.items():
+            durations = np.fromiter((a.get("duration", 0) for a in acts),
+                                    dtype=np.int64, count=len(acts))
+            perfs = np.asarray([a["performance"] for a in acts
+                                if "performance" in a], dtype=np.float64)
+            dates = [a["_date_only"] for a in acts if "performance" in a]
+            self._ex_stats[name] = (durations, perfs, dates)
+
+        # Create exercise tabs
+        exercises = sorted(self._by_exercise)
+        
+        tabs_frame = tk.Frame(charts_frame, bg=self.theme["bg_main"])
+        self._register_themed(tabs_frame, bg="bg_main")
+        tabs_frame.pack(fill='x')
+        
+        # Track current selected tab
+        self.selected_tab = tk.StringVar(value=exercises[0] if exercises else "")
+        
+        bg_ter = self.theme["bg_tertiary"]
+        text_pri = self.theme["text_primary"]
+        for exercise in exercises:
+            tab_button = tk.Button(tabs_frame, text=exercise, font=self.normal_font,
+                                 bg=bg_ter, fg=text_pri,
+                                 padx=15, pady=8, bd=0,
+                                 command=partial(self.change_progress_tab, exercise))
+            tab_button.pack(side="left", padx=5, pady=5)
+        
+        # Add content frame for selected exercise
+        self.progress_content = tk.Frame(charts_frame, bg=self.theme["bg_main"])
+        self._register_themed(self.progress_content, bg="bg_main")
+        self.progress_content.pack(fill='both', expand=True, pady=10)
+
+        # Fixed areas so tab switches can rebuild the stats and session
+        # list while the chart widget in the middle stays alive
+        self._prog_stats_area = tk.Frame(self.progress_content, bg=self.theme["bg_main"])
+        self._register_themed(self._prog_stats_area, bg="bg_main")
+        self._prog_stats_area.pack(fill='x')
+        self._prog_chart_area = tk.Frame(self.progress_content, bg=self.theme["bg_main"])
+        self._register_themed(self._prog_chart_area, bg="bg_main")
+        self._prog_chart_area.pack(fill='both', expand=True)
+        self._prog_sessions_area = tk.Frame(self.progress_content, bg=self.theme["bg_main"])
+        self._register_themed(self._prog_sessions_area, bg="bg_main")
+        self._prog_sessions_area.pack(fill='x')
+        self._prog_canvas = None
+
+        # Recent sessions table, built once and refilled per tab
+        sessions_label = tk.Label(self._prog_sessions_area, text="Recent Sessions",
+                                font=self.subheading_font,
+                                bg=self.theme["bg_main"], fg=self.theme["text_primary"])
+        self._register_themed(sessions_label, bg="bg_main", fg="text_primary")
+        sessions_label.pack(anchor="w", padx=15, pady=(15, 10))
+
+        self._sessions_tree = ttk.Treeview(self._prog_sessions_area,
+                                           columns=("date", "duration", "perf"),
+                                           show="headings", height=10)
+        for col, text in (("date", "Date"), ("duration", "Duration"),
+                          ("perf", "Performance")):
+            self._sessions_tree.heading(col, text=text)
+            self._sessions_tree.column(col, anchor="w")
+        self._sessions_tree.pack(fill='x', padx=15, pady=(0, 15))
+        
+        # Show first exercise by default
+        if exercises:
+            self.change_progress_tab(exercises[0])
+    
+    def change_progress_tab(self, exercise):
+        self.selected_tab.set(exercise)
+        self.clear_frame(self._prog_stats_area)
+        
+        # Activities were grouped by exercise when the page was built
+        exercise_activities = self._by_exercise.get(exercise, [])
+        
+        if not exercise_activities:
+            return
+
+        # Columns were prepared at grouping time; the stats cards are just
+        # reductions over them
+        durations, perfs, dates = self._ex_stats[exercise]
+        total_time = int(durations.sum())
+
+        # Bind the theme and font lookups once; the card loop below would
+        # otherwise repeat them for every widget it creates
+        bg_sec = self.theme["bg_secondary"]
+        text_sec = self.theme["text_secondary"]
+        text_pri = self.theme["text_primary"]
+
+        # Create stats summary
+        stats_frame = tk.Frame(self._prog_stats_area, bg=self.theme["bg_main"])
+        self._register_themed(stats_frame, bg="bg_main")
+        stats_frame.pack(fill='x', pady=10)
+
+        cards = [("Total Sessions", str(len(exercise_activities))),
+                 ("Total Time", f"{total_time} min")]
+        if perfs.size:
+            cards.append(("Avg Performance", f"{int(perfs.mean())}%"))
+        for col, (title, value) in enumerate(cards):
+            card = tk.Frame(stats_frame, bg=bg_sec, padx=15, pady=15)
+            card.grid(row=0, column=col, padx=10, pady=10, sticky="nsew")
+            card_label = tk.Label(card, text=title, font=self.normal_font,
+                                  bg=bg_sec, fg=text_sec)
+            card_label.pack(anchor="w")
+            card_value = tk.Label(card, text=value, font=self.subheading_font,
+                                  bg=bg_sec, fg=text_pri)
+            card_value.pack(anchor="w")
+        
+        # Update the performance-over-time chart in place: the figure,
+        # line and Tk canvas are built once per page and tab switches only
+        # push new data through set_data + draw_idle
+        if perfs.size:
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            if self._prog_canvas is None:
+                chart_label = tk.Label(self._prog_chart_area, text="Performance History",
+                                     font=self.subheading_font,
+                                     bg=self.theme["bg_main"], fg=self.theme["text_primary"])
+                self._register_themed(chart_label, bg="bg_main", fg="text_primary")
+                chart_label.pack(anchor="w", padx=15, pady=(15, 10))
+                if self._prog_fig is None:
+                    from matplotlib.figure import Figure
+                    self._prog_fig = Figure(figsize=(8, 4), dpi=100)
+                    self._prog_ax = self._prog_fig.add_subplot(111)
+                    self._prog_line, = self._prog_ax.plot([], [], marker='o',
+                                                          color=self.theme["accent"])
+                    self._prog_ax.set_ylabel('Performance (%)')
+                    self._prog_ax.set_xlabel('Date')
+                    self._prog_ax.grid(True, alpha=0.3)
+                    self._apply_chart_theme()
+                self._prog_canvas = FigureCanvasTkAgg(self._prog_fig,
+                                                      master=self._prog_chart_area)
+                self._prog_canvas.get_tk_widget().pack(fill='both', expand=True,
+                                                       padx=15, pady=(0, 15))
+            self._prog_line.set_data(np.arange(len(perfs)), perfs)
+            self._prog_ax.set_xticks(np.arange(len(dates)))
+            self._prog_ax.set_xticklabels(dates, rotation=45, ha='right')
+            self._prog_ax.relim()
+            self._prog_ax.autoscale_view()
+            self._prog_canvas.draw_idle()
+        elif self._prog_canvas is not None:
+            self._prog_line.set_data([], [])
+            self._prog_canvas.draw_idle()
+        
+        # Repopulate the virtualized session list; the Treeview itself is
+        # built once in show_progress and pools its row widgets internally
+        tree = self._sessions_tree
+        tree.delete(*tree.get_children())
+        # Most recent ten by date (ISO-style strings sort correctly);
+        # nlargest is O(n log 10) against a full sort's O(n log n)
+        recent = heapq.nlargest(10, exercise_activities, key=lambda a: a["date"])
+        for activity in recent:
+            perf = activity.get("performance")
+            tree.insert("", "end", values=(activity["date"],
+                                           f"{activity.get('duration', 0)} min",
+                                           f"{perf}%" if perf is not None else ""))
+    
+    def show_settings(self):
+        self.show_page("settings", self.create_settings)
+
+    def create_settings(self, parent):
+        
+        # Create header
+        header_frame = tk.Frame(parent, bg=self.theme["bg_main"], padx=20, pady=20)
+        self._register_themed(header_frame, bg="bg_main")
+        header_frame.pack(fill='x')
+        
+        header_label = tk.Label(header_frame, text="Settings", font=self.heading_font,
+                              bg=self.theme["bg_main"], fg=self.theme["text_primary"])
+        self._register_themed(header_label, bg="bg_main", fg="text_primary")
+        header_label.pack(anchor="w")
+        
+        # Create settings frame
+        settings_frame = tk.Frame(parent, bg=self.theme["bg_main"], padx=20, pady=10)
+        self._register_themed(settings_frame, bg="bg_main")
+        settings_frame.pack(fill='both')
+        
+        # User profile section
+        profile_frame = tk.Frame(settings_frame, bg=self.theme["bg_secondary"], padx=20, pady=20)
+        self._register_themed(profile_frame, bg="bg_secondary")
+        profile_frame.pack(fill='x', pady=10)
+        
+        # Rows go straight onto the section frame via grid; no per-row
+        # wrapper frames for Tk's pack machinery to re-traverse
+        profile_frame.columnconfigure(1, weight=1)
+        profile_label = tk.Label(profile_frame, text="User Profile", font=self.subheading_font,
+                               bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
+        self._register_themed(profile_label, bg="bg_secondary", fg="text_primary")
+        profile_label.grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 10))
+        
+        # User name
+        name_label = tk.Label(profile_frame, text="Display Name:", font=self.normal_font,
+                            bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"], width=15, anchor="w")
+        self._register_themed(name_label, bg="bg_secondary", fg="text_secondary")
+        name_label.grid(row=1, column=0, sticky="w", pady=5)
+        
+        name_entry = ttk.Entry(profile_frame, font=self.normal_font)
+        name_entry.insert(0, self.current_user)
+        name_entry.grid(row=1, column=1, sticky="ew", pady=5)
+        
+        # Save profile button
+        save_button = tk.Button(profile_frame, text="Save Profile", font=self.normal_font,
+                              bg=self.theme["accent"], fg="white", padx=15, pady=5,
+                              command=lambda: self.save_user_profile(name_entry.get()))
+        self._register_themed(save_button, bg="accent")
+        save_button.grid(row=2, column=1, sticky="e", pady=(10, 0))
+        
+        # App settings section
+        app_frame = tk.Frame(settings_frame, bg=self.theme["bg_secondary"], padx=20, pady=20)
+        self._register_themed(app_frame, bg="bg_secondary")
+        app_frame.pack(fill='x', pady=10)
+        
+        app_label = tk.Label(app_frame, text="Application Settings", font=self.subheading_font,
+                           bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
+        self._register_themed(app_label, bg="bg_secondary", fg="text_primary")
+        app_label.grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 10))
+        
+        # Toggle rows: dark mode, voice feedback, high accuracy (slower
+        # pose model, better landmarks) and the quantized detector
+        toggles = [
+            ("Dark Mode:", self.dark_mode, self.toggle_theme),
+            ("Voice Feedback:", self.use_voice_feedback, None),
+            ("High Accuracy:", self.high_accuracy, self.toggle_accuracy_mode),
+            ("Fast Detector:", self.use_int8, self.toggle_int8_mode),
+        ]
+        for row, (text, variable, command) in enumerate(toggles, start=1):
+            label = tk.Label(app_frame, text=text, font=self.normal_font,
+                             bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"],
+                             width=15, anchor="w")
+            self._register_themed(label, bg="bg_secondary", fg="text_secondary")
+            label.grid(row=row, column=0, sticky="w", pady=5)
+            toggle = ttk.Checkbutton(app_frame, variable=variable, command=command)
+            toggle.grid(row=row, column=1, sticky="w", pady=5)
+        
+        # Camera settings
+        camera_frame = tk.Frame(settings_frame, bg=self.theme["bg_secondary"], padx=20, pady=20)
+        self._register_themed(camera_frame, bg="bg_secondary")
+        camera_frame.pack(fill='x', pady=10)
+        
+        camera_frame.columnconfigure(2, weight=1)
+        camera_label = tk.Label(camera_frame, text="Camera Settings", font=self.subheading_font,
+                              bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
+        self._register_themed(camera_label, bg="bg_secondary", fg="text_primary")
+        camera_label.grid(row=0, column=0, columnspan=3, sticky="w", pady=(0, 10))
+        
+        # Camera selection
+        cam_label = tk.Label(camera_frame, text="Camera ID:", font=self.normal_font,
+                           bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"], width=15, anchor="w")
+        self._register_themed(cam_label, bg="bg_secondary", fg="text_secondary")
+        cam_label.grid(row=1, column=0, sticky="w", pady=5)
+        
+        cam_value = tk.StringVar(value=str(self.camera_id))
+        cam_entry = ttk.Entry(camera_frame, textvariable=cam_value, font=self.normal_font, width=5)
+        cam_entry.grid(row=1, column=1, sticky="w", pady=5)
+        
+        cam_test = tk.Button(camera_frame, text="Test Camera", font=self.normal_font,
+                           bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"], padx=15, pady=5,
+                           command=lambda: self.test_camera(int(cam_value.get())))
+        self._register_themed(cam_test, bg="bg_tertiary", fg="text_primary")
+        cam_test.grid(row=1, column=2, sticky="w", padx=10, pady=5)
+
+        # Detection interval (run YOLO every N-th frame)
+        interval_label = tk.Label(camera_frame, text="Detect Every:", font=self.normal_font,
+                                bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"], width=15, anchor="w")
+        self._register_themed(interval_label, bg="bg_secondary", fg="text_secondary")
+        interval_label.grid(row=2, column=0, sticky="w", pady=5)
+
+        interval_value = tk.StringVar(value=str(self.yolo_every))
+
+        def apply_interval(*_):
+            try:
+                self.yolo_every = max(1, int(interval_value.get()))
+            except ValueError:
+                pass
+
+        interval_value.trace_add("write", apply_interval)
+        interval_spin = ttk.Spinbox(camera_frame, from_=1, to=15, textvariable=interval_value,
+                                  font=self.normal_font, width=5)
+        interval_spin.grid(row=2, column=1, sticky="w", pady=5)
+
+        frames_label = tk.Label(camera_frame, text="frames", font=self.small_font,
+                              bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"])
+        self._register_themed(frames_label, bg="bg_secondary", fg="text_secondary")
+        frames_label.grid(row=2, column=2, sticky="w", padx=10, pady=5)
+        
+        # Calibration button
+        calibrate_button = tk.Button(camera_frame, text="Calibrate Camera", font=self.normal_font,
+                                   bg=self.theme["accent"], fg="white", padx=15, pady=5,
+                                   command=self.start_calibration)
+        self._register_themed(calibrate_button, bg="accent")
+        calibrate_button.grid(row=3, column=0, columnspan=3, sticky="e", pady=(10, 0))
+        
+        # Data management section
+        data_frame = tk.Frame(settings_frame, bg=self.theme["bg_secondary"], padx=20, pady=20)
+        self._register_themed(data_frame, bg="bg_secondary")
+        data_frame.pack(fill='x', pady=10)
+        
+        data_label = tk.Label(data_frame, text="Data Management", font=self.subheading_font,
+                            bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
+        self._register_themed(data_label, bg="bg_secondary", fg="text_primary")
+        data_label.pack(anchor="w", pady=(0, 10))
+        
+        # Export data button
+        export_button = tk.Button(data_frame, text="Export Exercise Data", font=self.normal_font,
+                                bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"], padx=15, pady=5,
+                                command=self.export_data)
+        self._register_themed(export_button, bg="bg_tertiary", fg="text_primary")
+        export_button.pack(anchor="w")
+        
+        # Clear data button
+        clear_button = tk.Button(data_frame, text="Clear All Data", font=self.normal_font,
+                               bg=self.theme["error"], fg="white", padx=15, pady=5,
+                               command=self.clear_data)
+        self._register_themed(clear_button, bg="error")
+        clear_button.pack(anchor="w", pady=10)
+        
+        # About section
+        about_frame = tk.Frame(settings_frame, bg=self.theme["bg_secondary"], padx=20, pady=20)
+        self._register_themed(about_frame, bg="bg_secondary")
+        about_frame.pack(fill='x', pady=10)
+        
+        about_label = tk.Label(about_frame, text="About", font=self.subheading_font,
+                             bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
+        self._register_themed(about_label, bg="bg_secondary", fg="text_primary")
+        about_label.pack(anchor="w", pady=(0, 10))
+        
+        version_label = tk.Label(about_frame, text="Exercise Posture Pro - Version 2.0", font=self.normal_font,
+                               bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
+        self._register_themed(version_label, bg="bg_secondary", fg="text_primary")
+        version_label.pack(anchor="w")
+        
+        desc_label = tk.Label(about_frame, text="Advanced exercise form correction system using computer vision",
+                            font=self.small_font, bg=self.theme["bg_secondary"], fg=self.theme["text_secondary"],
+                            wraplength=600, justify="left")
+        self._register_themed(desc_label, bg="bg_secondary", fg="text_secondary")
+        desc_label.pack(anchor="w", pady=(5, 10))
+        
+        # Add links
+        help_button = tk.Button(about_frame, text="Help & Documentation", font=self.normal_font,
+                              bg=self.theme["bg_tertiary"], fg=self.theme["text_primary"], padx=15, pady=5,
+                              command=partial(webbrowser.open, "https://example.com/help"))
+        self._register_themed(help_button, bg="bg_tertiary", fg="text_primary")
+        help_button.pack(anchor="w")
+    
+    def test_camera(self, camera_id):
+        if cv2 is None:
+            messagebox.showinfo("Loading", "Camera support is still loading, please wait a moment...")
+            return
+
+        # Test if camera is accessible; the context manager guarantees the
+        # handle is released even when the probe raises
+        try:
+            with self._camera(camera_id) as cap:
+                if not cap.isOpened():
+                    messagebox.showerror("Error", f"Could not open camera ID {camera_id}")
+                    return
+
+                ret, frame = cap.read()
+                if not ret:
+                    messagebox.showerror("Error", f"Could not read from camera ID {camera_id}")
+                    return
+
+                # Camera works, update setting
+                self.camera_id = camera_id
+                messagebox.showinfo("Success", f"Camera ID {camera_id} is working properly")
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Error testing camera: {str(e)}")
+    
+    def start_calibration(self):
+        messagebox.showinfo("Calibration", "Camera calibration feature coming soon!")
+    
+    def export_data(self):
+        # Ask for export location
+        export_path = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+            title="Export Exercise Data"
+        )
+        
+        if not export_path:
+            return
+            
+        # Read and write on the I/O pool; only the result dialog comes
+        # back to the Tk thread, so big histories never freeze the UI.
+        # Derived underscore keys stay out of the exported file.
+        activities = [{k: v for k, v in a.items() if not k.startswith("_")}
+                      for a in self.load_recent_activities()]
+
+        def write_export():
+            try:
+                if orjson is not None:
+                    data = orjson.dumps(activities, option=orjson.OPT_INDENT_2)
+                else:
+                    data = json.dumps(activities, indent=4).encode("utf-8")
+                with open(export_path, "wb") as f:
+                    f.write(data)
+            except Exception as e:
+                self._safe_after(messagebox.showerror, "Error",
+                                 f"Error exporting data: {str(e)}")
+            else:
+                self._safe_after(messagebox.showinfo, "Success",
+                                 f"Data exported successfully to {export_path}")
+
+        self._io_pool.submit(write_export)
+    
+    def clear_data(self):
+        # Confirm before clearing
+        confirm = messagebox.askyesno("Confirm", "Are you sure you want to clear all activity data? This cannot be undone.")
+        
+        if confirm:
+            try:
+                for data_path in (self.activities_path(),
+                                  os.path.join(self.app_dir, "data", "activities.json")):
+                    if os.path.exists(data_path):
+                        os.remove(data_path)
+                self._activities_cache = None
+                self._activities_mtime = None
+                self.invalidate_page("dashboard")
+                self.invalidate_page("progress")
+                    
+                messagebox.showinfo("Success", "All activity data has been cleared")
+                
+            except Exception as e:
+                messagebox.showerror("Error", f"Error clearing data: {str(e)}")
+    
+    def show_help(self):
+        self.show_page("help", self.create_help)
+
+    def create_help(self, parent):
+        
+        # Create header
+        header_frame = tk.Frame(parent, bg=self.theme["bg_main"], padx=20, pady=20)
+        self._register_themed(header_frame, bg="bg_main")
+        header_frame.pack(fill='x')
+        
+        header_label = tk.Label(header_frame, text="Help & Documentation", font=self.heading_font,
+                              bg=self.theme["bg_main"], fg=self.theme["text_primary"])
+        self._register_themed(header_label, bg="bg_main", fg="text_primary")
+        header_label.pack(anchor="w")
+        
+        # Create help content
+        help_frame = tk.Frame(parent, bg=self.theme["bg_main"], padx=20, pady=10)
+        self._register_themed(help_frame, bg="bg_main")
+        help_frame.pack(fill='both', expand=True)
+        
+        # Getting started section
+        start_frame = tk.Frame(help_frame, bg=self.theme["bg_secondary"], padx=20, pady=20)
+        self._register_themed(start_frame, bg="bg_secondary")
+        start_frame.pack(fill='x', pady=10)
+        
+        start_label = tk.Label(start_frame, text="Getting Started", font=self.subheading_font,
+                             bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
+        self._register_themed(start_label, bg="bg_secondary", fg="text_primary")
+        start_label.pack(anchor="w", pady=(0, 10))
+        
+        steps = [
+            "1. Select an exercise from the Dashboard or Exercise Selection page",
+            "2. Position yourself in front of the camera so your full body is visible",
+            "3. Click 'Start Camera' to begin exercise tracking",
+            "4. Follow the on-screen feedback to improve your form",
+            "5. Complete your exercise session and view your performance summary"
+        ]
+        
+        for step in steps:
+            step_label = tk.Label(start_frame, text=step, font=self.normal_font,
+                                bg=self.theme["bg_secondary"], fg=self.theme["text_primary"],
+                                wraplength=800, justify="left")
+            self._register_themed(step_label, bg="bg_secondary", fg="text_primary")
+            step_label.pack(anchor="w", pady=5)
+        
+        # Exercise guide section
+        guide_frame = tk.Frame(help_frame, bg=self.theme["bg_secondary"], padx=20, pady=20)
+        self._register_themed(guide_frame, bg="bg_secondary")
+        guide_frame.pack(fill='x', pady=10)
+        
+        guide_label = tk.Label(guide_frame, text="Exercise Guide", font=self.subheading_font,
+                             bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
+        self._register_themed(guide_label, bg="bg_secondary", fg="text_primary")
+        guide_label.pack(anchor="w", pady=(0, 10))
+        
+        exercises = [
+            "Bicep Curl - Stand with arms extended, bend at the elbow to lift weights toward shoulders",
+            "Push-up - Start in plank position, lower body until elbows reach 90°, then push back up",
+            "Squat - Stand with feet shoulder-width apart, bend knees to lower body, keep back straight",
+            "Shoulder Press - Start with weights at shoulder height, push directly upward until arms extend"
+        ]
+        
+        for ex in exercises:
+            ex_label = tk.Label(guide_frame, text=ex, font=self.normal_font,
+                              bg=self.theme["bg_secondary"], fg=self.theme["text_primary"],
+                              wraplength=800, justify="left")
+            self._register_themed(ex_label, bg="bg_secondary", fg="text_primary")
+            ex_label.pack(anchor="w", pady=5)
+        
+        # Troubleshooting section
+        trouble_frame = tk.Frame(help_frame, bg=self.theme["bg_secondary"], padx=20, pady=20)
+        self._register_themed(trouble_frame, bg="bg_secondary")
+        trouble_frame.pack(fill='x', pady=10)
+        
+        trouble_label = tk.Label(trouble_frame, text="Troubleshooting", font=self.subheading_font,
+                               bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
+        self._register_themed(trouble_label, bg="bg_secondary", fg="text_primary")
+        trouble_label.pack(anchor="w", pady=(0, 10))
+        
+        issues = [
+            "Camera not working - Check camera ID in Settings and ensure no other application is using the camera",
+            "Poor pose detection - Ensure good lighting and that your full body is visible in the frame",
+            "Inaccurate angle measurement - Try the camera calibration feature in Settings",
+            "Application running slowly - Close other applications that might be using system resources"
+        ]
+        
+        for issue in issues:
+            issue_label = tk.Label(trouble_frame, text=issue, font=self.normal_font,
+                                 bg=self.theme["bg_secondary"], fg=self.theme["text_primary"],
+                                 wraplength=800, justify="left")
+            self._register_themed(issue_label, bg="bg_secondary", fg="text_primary")
+            issue_label.pack(anchor="w", pady=5)
+        
+        # Contact section
+        contact_frame = tk.Frame(help_frame, bg=self.theme["bg_secondary"], padx=20, pady=20)
+        self._register_themed(contact_frame, bg="bg_secondary")
+        contact_frame.pack(fill='x', pady=10)
+        
+        contact_label = tk.Label(contact_frame, text="Contact & Support", font=self.subheading_font,
+                               bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
+        self._register_themed(contact_label, bg="bg_secondary", fg="text_primary")
+        contact_label.pack(anchor="w", pady=(0, 10))
+        
+        email_label = tk.Label(contact_frame, text="For support, email: support@exerciseposturepro.com",
+                             font=self.normal_font, bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
+        self._register_themed(email_label, bg="bg_secondary", fg="text_primary")
+        email_label.pack(anchor="w", pady=5)
+        
+        website_label = tk.Label(contact_frame, text="Visit our website: www.exerciseposturepro.com",
+                               font=self.normal_font, bg=self.theme["bg_secondary"], fg=self.theme["text_primary"])
+        self._register_themed(website_label, bg="bg_secondary", fg="text_primary")
+        website_label.pack(anchor="w", pady=5)
+    
+    def write_json_atomic(self, path, obj):
+        # Serialize in one shot (orjson handles numpy natively at C speed)
+        # and write through a temp file + os.replace so a crash mid-write
+        # can never leave a corrupt file behind
+        if orjson is not None:
+            data = orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            data = json.dumps(obj).encode("utf-8")
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def read_json(self, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+
+    def save_user_profile(self, name):
+        if name.strip():
+            self.current_user = name.strip()
+            
+            # Save user profile
+            self.write_json_atomic(os.path.join(self.app_dir, "profiles", "user.json"),
+                                   {"name": self.current_user})
+                
+            messagebox.showinfo("Success", "User profile saved successfully")
+
+            # Update dashboard
+            self.invalidate_page("dashboard")
+            if self.current_page == "dashboard":
+                self.show_dashboard()
+    
+    def load_user_data(self):
+        # Load user profile
+        try:
+            profile_path = os.path.join(self.app_dir, "profiles", "user.json")
+            if os.path.exists(profile_path):
+                profile = self.read_json(profile_path)
+                self.current_user = profile.get("name", "Default User")
+        except:
+            pass
+    
+    def activities_path(self):
+        return os.path.join(self.app_dir, "data", "activities.jsonl")
+
+    def append_activity(self, session):
+        line = (orjson.dumps(session) if orjson is not None
+                else json.dumps(session).encode("utf-8"))
+        with open(self.activities_path(), "ab") as f:
+            f.write(line + b"\n")
+
+    def load_recent_activities(self):
+        try:
+            path = self.activities_path()
+            legacy = os.path.join(self.app_dir, "data", "activities.json")
+            if not os.path.exists(path) and os.path.exists(legacy):
+                # One-time migration from the old rewrite-everything format
+                for activity in self.read_json(legacy):
+                    self.append_activity(activity)
+                os.remove(legacy)
+            if os.path.exists(path):
+                # Serve from the in-memory copy unless the file changed on
+                # disk since it was last parsed
+                mtime = os.stat(path).st_mtime_ns
+                if mtime == self._activities_mtime:
+                    return self._activities_cache
+                loads = orjson.loads if orjson is not None else json.loads
+                with open(path, "rb") as f:
+                    lines = deque(f, maxlen=20)
+                if os.path.getsize(path) > 1_000_000:
+                    # Compact down to the lines still shown anywhere
+                    tmp = path + ".tmp"
+                    with open(tmp, "wb") as f:
+                        f.writelines(lines)
+                    os.replace(tmp, path)
+                    mtime = os.stat(path).st_mtime_ns
+                self._activities_cache = [loads(line) for line in lines]
+                for a in self._activities_cache:
+                    # Date-only label precomputed once per parse so tab
+                    # switches do no per-activity string work
+                    a["_date_only"] = a.get("date", "").partition(" ")[0]
+                self._activities_mtime = mtime
+                return self._activities_cache
+        except:
+            pass
+        return []
+    
+# Main entry point
+if __name__ == "__main__":
+    root = tk.Tk()
+    app = ExercisePoseApp(root)
     root.mainloop()
\ No newline at end of file